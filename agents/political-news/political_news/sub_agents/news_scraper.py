@@ -14,11 +14,19 @@
 
 """News Scraper Sub-Agent: Gathers political news from multiple APIs."""
 
+import heapq
 import logging
 import os
+import threading
+import time
 import requests
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from requests.adapters import HTTPAdapter
 from datetime import datetime, timedelta, timezone
-from typing import List, Dict, Any, Optional
+from operator import itemgetter
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 from google.adk.agents import LlmAgent
 from google.adk.tools.agent_tool import AgentTool
@@ -29,6 +37,121 @@ MODEL = "gemini-2.5-pro"
 
 logger = logging.getLogger(__name__)
 
+# One keep-alive session for every news API call, so repeat scrapes reuse
+# connections instead of paying a TCP/TLS handshake per request
+_session = requests.Session()
+_adapter = HTTPAdapter(pool_connections=4, pool_maxsize=8)
+_session.mount("https://", _adapter)
+_session.mount("http://", _adapter)
+
+# Recent scrape results by normalized topic, so an agent asking about the same
+# topic again within the TTL does not repeat three external API calls
+_SCRAPE_CACHE_TTL_SECONDS = 300
+_SCRAPE_CACHE_MAX_ENTRIES = 256
+_scrape_cache: "OrderedDict[str, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+_scrape_cache_lock = threading.Lock()
+
+@dataclass(frozen=True)
+class _SourceSpec:
+    """How to query one news API and map its articles onto the common shape."""
+    name: str
+    method: str  # NewsAPIClient wrapper the scrape calls for this source
+    url: str
+    key_attr: str  # NewsAPIClient attribute holding the API key
+    key_env: str
+    params: Callable[[str, str], Dict[str, Any]]  # (topic, api_key) -> query params
+    items_key: str
+    fields: Tuple[Tuple[str, str], ...]  # (article field, dotted path in the API item or "")
+
+_SOURCES = (
+    _SourceSpec(
+        name="NewsAPI",
+        method="get_newsapi_articles",
+        url="https://newsapi.org/v2/everything",
+        key_attr="newsapi_key",
+        key_env="NEWSAPI_KEY",
+        params=lambda topic, key: {
+            "q": topic,
+            "language": "en",
+            "sortBy": "publishedAt",
+            "apiKey": key,
+            "pageSize": 20,
+        },
+        items_key="articles",
+        fields=(
+            ("title", "title"),
+            ("description", "description"),
+            ("content", "content"),
+            ("url", "url"),
+            ("source", "source.name"),
+            ("publishedAt", "publishedAt"),
+        ),
+    ),
+    _SourceSpec(
+        name="GNews",
+        method="get_gnews_articles",
+        url="https://gnews.io/api/v4/search",
+        key_attr="gnews_key",
+        key_env="GNEWS_API_KEY",
+        params=lambda topic, key: {
+            "q": topic,
+            "lang": "en",
+            "country": "us",
+            "max": 20,
+            "sortby": "publishedAt",
+            "apikey": key,
+        },
+        items_key="articles",
+        fields=(
+            ("title", "title"),
+            ("description", "description"),
+            ("content", "content"),
+            ("url", "url"),
+            ("source", "source.name"),
+            ("publishedAt", "publishedAt"),
+        ),
+    ),
+    _SourceSpec(
+        name="MediaStack",
+        method="get_mediastack_articles",
+        url="http://api.mediastack.com/v1/news",
+        key_attr="mediastack_key",
+        key_env="MEDIASTACK_API_KEY",
+        params=lambda topic, key: {
+            "access_key": key,
+            "keywords": topic,
+            "languages": "en",
+            "countries": "us",
+            "limit": 20,
+            "sort": "published_desc",
+        },
+        items_key="data",
+        fields=(
+            ("title", "title"),
+            ("description", "description"),
+            ("content", ""),  # MediaStack doesn't provide content
+            ("url", "url"),
+            ("source", "source"),
+            ("publishedAt", "published_at"),
+        ),
+    ),
+)
+
+_SOURCES_BY_NAME = {spec.name: spec for spec in _SOURCES}
+
+# The news APIs are independent, so one scrape queries them all at once
+_FETCH_POOL = ThreadPoolExecutor(max_workers=len(_SOURCES), thread_name_prefix="news-fetch")
+
+def _dig(item: Any, path: str) -> Any:
+    """Follow a dotted path through nested dicts, or return "" if any step is missing."""
+    if not path:
+        return ""
+    for key in path.split("."):
+        if not isinstance(item, dict) or key not in item:
+            return ""
+        item = item[key]
+    return item
+
 class NewsAPIClient:
     """Client for various news APIs."""
     
@@ -37,192 +160,106 @@ class NewsAPIClient:
         self.gnews_key = os.getenv("GNEWS_API_KEY")
         self.mediastack_key = os.getenv("MEDIASTACK_API_KEY")
         self.newsdata_key = os.getenv("NEWSDATA_API_KEY")
-        
-    def get_newsapi_articles(self, topic: str) -> List[Dict[str, Any]]:
-        """Get articles from NewsAPI.org."""
-        if not self.newsapi_key:
-            logger.warning("NEWSAPI_KEY not found in environment variables")
+    
+    def fetch(self, spec: _SourceSpec, topic: str) -> List[Dict[str, Any]]:
+        """Get articles about a topic from one news API, in the common article shape."""
+        api_key = getattr(self, spec.key_attr)
+        if not api_key:
+            logger.warning(f"{spec.key_env} not found in environment variables")
             return []
-            
+        
         try:
-            url = "https://newsapi.org/v2/everything"
-            params = {
-                "q": f"{topic}",  # Simplified query for better results
-                "language": "en",
-                "sortBy": "publishedAt",
-                "apiKey": self.newsapi_key,
-                "pageSize": 20
-            }
-            
-            response = requests.get(url, params=params, timeout=10)
+            response = _session.get(spec.url, params=spec.params(topic, api_key), timeout=10)
             
             # Handle rate limiting gracefully
             if response.status_code == 429:
-                logger.warning("NewsAPI rate limit reached, skipping this source")
+                logger.warning(f"{spec.name} rate limit reached, skipping this source")
                 return []
             elif response.status_code != 200:
-                logger.error(f"NewsAPI error {response.status_code}: {response.text[:100]}")
+                logger.error(f"{spec.name} error {response.status_code}: {response.text[:100]}")
                 return []
             
             data = response.json()
-            articles = data.get("articles", [])
             
             # Process all articles without time filtering
             processed_articles = []
-            
-            for article in articles:
-                try:
-                    processed_articles.append({
-                        "title": article.get("title", ""),
-                        "description": article.get("description", ""),
-                        "content": article.get("content", ""),
-                        "url": article.get("url", ""),
-                        "source": article.get("source", {}).get("name", ""),
-                        "publishedAt": article.get("publishedAt", ""),
-                        "api_source": "NewsAPI"
-                    })
-                except (ValueError, KeyError) as e:
-                    logger.warning(f"Skipping article due to parsing error: {e}")
-                    continue
+            for article in data.get(spec.items_key, []):
+                processed = {field: _dig(article, path) for field, path in spec.fields}
+                processed["api_source"] = spec.name
+                processed_articles.append(processed)
             
             return processed_articles
             
         except Exception as e:
-            logger.error(f"Error fetching from NewsAPI: {e}")
+            logger.error(f"Error fetching from {spec.name}: {e}")
             return []
     
+    def get_newsapi_articles(self, topic: str) -> List[Dict[str, Any]]:
+        """Get articles from NewsAPI.org."""
+        return self.fetch(_SOURCES_BY_NAME["NewsAPI"], topic)
+    
     def get_gnews_articles(self, topic: str) -> List[Dict[str, Any]]:
         """Get articles from GNews API."""
-        if not self.gnews_key:
-            logger.warning("GNEWS_API_KEY not found in environment variables")
-            return []
-            
-        try:
-            url = "https://gnews.io/api/v4/search"
-            params = {
-                "q": f"{topic}",  # Simplified query for better results
-                "lang": "en",
-                "country": "us",
-                "max": 20,
-                "apikey": self.gnews_key
-            }
-            
-            response = requests.get(url, params=params, timeout=10)
-            
-            # Handle rate limiting gracefully
-            if response.status_code == 429:
-                logger.warning("GNews rate limit reached, skipping this source")
-                return []
-            elif response.status_code != 200:
-                logger.error(f"GNews error {response.status_code}: {response.text[:100]}")
-                return []
-            
-            data = response.json()
-            articles = data.get("articles", [])
-            
-            # Process all articles without time filtering
-            processed_articles = []
-            
-            for article in articles:
-                try:
-                    processed_articles.append({
-                        "title": article.get("title", ""),
-                        "description": article.get("description", ""),
-                        "content": article.get("content", ""),
-                        "url": article.get("url", ""),
-                        "source": article.get("source", {}).get("name", ""),
-                        "publishedAt": article.get("publishedAt", ""),
-                        "api_source": "GNews"
-                    })
-                except (ValueError, KeyError) as e:
-                    logger.warning(f"Skipping article due to parsing error: {e}")
-                    continue
-            
-            return processed_articles
-            
-        except Exception as e:
-            logger.error(f"Error fetching from GNews: {e}")
-            return []
+        return self.fetch(_SOURCES_BY_NAME["GNews"], topic)
     
     def get_mediastack_articles(self, topic: str) -> List[Dict[str, Any]]:
         """Get articles from MediaStack API."""
-        if not self.mediastack_key:
-            logger.warning("MEDIASTACK_API_KEY not found in environment variables")
-            return []
-            
-        try:
-            url = "http://api.mediastack.com/v1/news"
-            params = {
-                "access_key": self.mediastack_key,
-                "keywords": f"{topic}",  # Simplified query for better results
-                "languages": "en",
-                "countries": "us",
-                "limit": 20,
-                "sort": "published_desc"
-            }
-            
-            response = requests.get(url, params=params, timeout=10)
-            
-            # Handle rate limiting gracefully
-            if response.status_code == 429:
-                logger.warning("MediaStack rate limit reached, skipping this source")
-                return []
-            elif response.status_code != 200:
-                logger.error(f"MediaStack error {response.status_code}: {response.text[:100]}")
-                return []
-            
-            data = response.json()
-            articles = data.get("data", [])
-            
-            # Process all articles without time filtering
-            processed_articles = []
-            
-            for article in articles:
-                try:
-                    processed_articles.append({
-                        "title": article.get("title", ""),
-                        "description": article.get("description", ""),
-                        "content": "",  # MediaStack doesn't provide content
-                        "url": article.get("url", ""),
-                        "source": article.get("source", ""),
-                        "publishedAt": article.get("published_at", ""),
-                        "api_source": "MediaStack"
-                    })
-                except (ValueError, KeyError) as e:
-                    logger.warning(f"Skipping article due to parsing error: {e}")
-                    continue
-            
-            return processed_articles
-            
-        except Exception as e:
-            logger.error(f"Error fetching from MediaStack: {e}")
-            return []
+        return self.fetch(_SOURCES_BY_NAME["MediaStack"], topic)
+
+def _normalize_key(text: Optional[str]) -> str:
+    """Normalize a headline or topic for matching, ignoring case and spacing."""
+    return " ".join((text or "").casefold().split())
 
 def scrape_political_news(request: str, hours: Optional[int] = None) -> Dict[str, Any]:
     """Scrape political news from multiple APIs for a given request."""
+    cache_key = _normalize_key(request)
+    now = time.monotonic()
+    with _scrape_cache_lock:
+        cached = _scrape_cache.get(cache_key)
+        if cached is not None and now - cached[0] < _SCRAPE_CACHE_TTL_SECONDS:
+            _scrape_cache.move_to_end(cache_key)
+            return _copy_result(cached[1])
+    
+    result = _scrape_political_news(request)
+    
+    # An empty result usually means every source failed (rate limit, bad key),
+    # so leave it uncached and let the next call try again
+    if result["total_articles"] > 0:
+        with _scrape_cache_lock:
+            _scrape_cache[cache_key] = (now, _copy_result(result))
+            _scrape_cache.move_to_end(cache_key)
+            while len(_scrape_cache) > _SCRAPE_CACHE_MAX_ENTRIES:
+                _scrape_cache.popitem(last=False)
+    return result
+
+def _copy_result(result: Dict[str, Any]) -> Dict[str, Any]:
+    """Copy a scrape result so callers never share the cached dict or its lists."""
+    return {**result, "articles": list(result["articles"]), "sources_used": list(result["sources_used"])}
+
+def _scrape_political_news(request: str) -> Dict[str, Any]:
+    """Query every news API for a request and merge the results."""
     client = NewsAPIClient()
     
-    # Gather articles from multiple sources (no time limit)
-    newsapi_articles = client.get_newsapi_articles(request)
-    gnews_articles = client.get_gnews_articles(request)
-    mediastack_articles = client.get_mediastack_articles(request)
+    # Gather articles from multiple sources concurrently (no time limit)
+    futures = [_FETCH_POOL.submit(getattr(client, spec.method), request) for spec in _SOURCES]
     
-    # Combine and deduplicate articles
-    all_articles = newsapi_articles + gnews_articles + mediastack_articles
+    # Every API is asked for newest-first results, so merging the per-source
+    # runs yields publication order (newest first) without a re-sort
+    all_articles = heapq.merge(
+        *(future.result() for future in futures),
+        key=itemgetter("publishedAt"), reverse=True,
+    )
     
     # Simple deduplication based on title similarity
     seen_titles = set()
     unique_articles = []
     
     for article in all_articles:
-        title_lower = article["title"].lower()
-        if title_lower not in seen_titles:
-            seen_titles.add(title_lower)
+        title_key = _normalize_key(article["title"])
+        if title_key not in seen_titles:
+            seen_titles.add(title_key)
             unique_articles.append(article)
     
-    # Sort by publication date (newest first)
-    unique_articles.sort(key=lambda x: x["publishedAt"], reverse=True)
-    
     return {
         "topic": request,
         "time_range": "No time limit - all available articles",
@@ -59,7 +59,7 @@ class TestNewsScraperAgent:
         assert hasattr(client, 'mediastack_key')
         assert hasattr(client, 'newsdata_key')
     
-    @patch('political_news.sub_agents.news_scraper.requests.get')
+    @patch('political_news.sub_agents.news_scraper._session.get')
     def test_get_newsapi_articles_success(self, mock_get):
         """Test successful NewsAPI article retrieval."""
         # Mock successful response
@@ -88,7 +88,7 @@ class TestNewsScraperAgent:
         assert articles[0]["title"] == "Test Political Article"
         assert articles[0]["api_source"] == "NewsAPI"
     
-    @patch('political_news.sub_agents.news_scraper.requests.get')
+    @patch('political_news.sub_agents.news_scraper._session.get')
     def test_get_newsapi_articles_no_key(self, mock_get):
         """Test NewsAPI article retrieval without API key."""
         client = NewsAPIClient()
@@ -99,7 +99,7 @@ class TestNewsScraperAgent:
         assert articles == []
         mock_get.assert_not_called()
     
-    @patch('political_news.sub_agents.news_scraper.requests.get')
+    @patch('political_news.sub_agents.news_scraper._session.get')
     def test_get_gnews_articles_success(self, mock_get):
         """Test successful GNews article retrieval."""
         # Mock successful response
@@ -128,7 +128,7 @@ class TestNewsScraperAgent:
         assert articles[0]["title"] == "Test GNews Article"
         assert articles[0]["api_source"] == "GNews"
     
-    @patch('political_news.sub_agents.news_scraper.requests.get')
+    @patch('political_news.sub_agents.news_scraper._session.get')
     def test_get_mediastack_articles_success(self, mock_get):
         """Test successful MediaStack article retrieval."""
         # Mock successful response
@@ -14,18 +14,30 @@
 
 """Routing Agent: Routes user requests to appropriate specialized agents."""
 
+import functools
+import importlib
+import importlib.util
+import logging
 import sys
 import os
 from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
 from dotenv import load_dotenv
 
-from google.adk.agents import LlmAgent
+from google.adk.agents import BaseAgent, LlmAgent
+from google.adk.agents.readonly_context import ReadonlyContext
 from google.adk.tools.agent_tool import AgentTool
+from google.adk.tools.base_tool import BaseTool
+from google.adk.tools.base_toolset import BaseToolset
+from google.adk.tools.tool_context import ToolContext
+from google.genai import types
 
 from . import prompt
 
 MODEL = "gemini-2.5-pro"
 
+logger = logging.getLogger(__name__)
+
 # Load environment variables from multiple locations
 def load_environment_variables():
     """Load environment variables from the backend root .env file."""
@@ -35,95 +47,149 @@ def load_environment_variables():
     
     if backend_env_file.exists():
         load_dotenv(backend_env_file)
-        print(f"✅ Loaded environment variables from {backend_env_file}")
+        logger.info("Loaded environment variables from %s", backend_env_file)
     else:
-        print(f"⚠️  No .env file found at {backend_env_file}")
+        logger.warning("No .env file found at %s", backend_env_file)
     
     # Check for required political news API keys
     political_keys = ["NEWSAPI_KEY", "GNEWS_API_KEY", "MEDIASTACK_API_KEY", "NEWSDATA_API_KEY"]
     available_keys = [key for key in political_keys if os.getenv(key)]
     
     if available_keys:
-        print(f"✅ Found {len(available_keys)} political news API keys: {', '.join(available_keys)}")
+        logger.info("Found %d political news API keys: %s", len(available_keys), ", ".join(available_keys))
     else:
-        print("⚠️  No political news API keys found. Political news agent may not work properly.")
-        print("   Please set at least one of: NEWSAPI_KEY, GNEWS_API_KEY, MEDIASTACK_API_KEY, NEWSDATA_API_KEY")
+        logger.warning(
+            "No political news API keys found; set at least one of %s", ", ".join(political_keys)
+        )
 
 # Load environment variables
 load_environment_variables()
 
-# Add parent directories to path to import the specialized agents
-current_dir = Path(__file__).parent
-backend_dir = current_dir.parent.parent.parent  # Go up 3 levels: routing_agent -> routing_agent -> agents -> backend
-agents_dir = backend_dir / "agents"
-academic_research_path = agents_dir / "academic-research"
-fomc_research_path = agents_dir / "fomc-research"
-political_news_path = agents_dir / "political-news"
-
-# Add paths to sys.path for imports
-if academic_research_path.exists():
-    sys.path.insert(0, str(academic_research_path))
-if fomc_research_path.exists():
-    sys.path.insert(0, str(fomc_research_path))
-if political_news_path.exists():
-    sys.path.insert(0, str(political_news_path))
-
-# Import the specialized agents with error handling
-AGENTS_AVAILABLE = False
-academic_coordinator = None
-fomc_research_agent = None
-political_news_coordinator = None
-
-try:
-    from academic_research import academic_coordinator
-    print("✅ Successfully imported Academic Research Agent")
-except ImportError as e:
-    print(f"⚠️  Warning: Could not import Academic Research Agent: {e}")
-    print("   This may be due to missing dependencies or authentication issues")
-
-try:
-    from fomc_research import fomc_research_agent
-    print("✅ Successfully imported FOMC Research Agent")
-    print("   Note: BigQuery functionality may not be available without proper credentials")
-except ImportError as e:
-    print(f"⚠️  Warning: Could not import FOMC Research Agent: {e}")
-    print("   This may be due to missing dependencies or authentication issues")
-    print("   The FOMC agent requires Google Cloud authentication to be set up")
-
-try:
-    from political_news import political_news_coordinator
-    print("✅ Successfully imported Political News Agent")
-except ImportError as e:
-    print(f"⚠️  Warning: Could not import Political News Agent: {e}")
-    print("   This may be due to missing dependencies or API key issues")
-
-# Check if agents are available
-available_agents = []
-if academic_coordinator is not None:
-    available_agents.append("Academic Research")
-if fomc_research_agent is not None:
-    available_agents.append("FOMC Research")
-if political_news_coordinator is not None:
-    available_agents.append("Political News")
-
-if len(available_agents) >= 2:
-    AGENTS_AVAILABLE = True
-    print(f"✅ Multiple specialized agents are available for routing: {', '.join(available_agents)}")
-elif len(available_agents) == 1:
-    print(f"✅ {available_agents[0]} Agent is available for routing")
-    print("⚠️  Other agents are not available")
-else:
-    print("⚠️  No specialized agents are available")
-    print("   The routing agent will still work but with limited functionality")
-
-# Create tools list with available agents
-tools = []
-if academic_coordinator is not None:
-    tools.append(AgentTool(agent=academic_coordinator))
-if fomc_research_agent is not None:
-    tools.append(AgentTool(agent=fomc_research_agent))
-if political_news_coordinator is not None:
-    tools.append(AgentTool(agent=political_news_coordinator))
+def _agent_loader(module_name: str, attr: str) -> Callable[[], Optional[BaseAgent]]:
+    """Return a cached getter that imports a specialized agent on first call.
+    
+    The specialized agents pull in Google Cloud, BigQuery and Vertex AI SDKs,
+    so they are only imported once a request is actually routed to them.
+    The getter returns None if the import fails.
+    """
+    @functools.cache
+    def load() -> Optional[BaseAgent]:
+        try:
+            agent = getattr(importlib.import_module(module_name), attr)
+        except Exception:
+            logger.exception("Could not load %s from %s; dropping it from routing", attr, module_name)
+            return None
+        logger.info("Loaded %s from %s", attr, module_name)
+        return agent
+    return load
+
+class _LazyAgentTool(AgentTool):
+    """AgentTool that resolves its agent on first invocation instead of at import."""
+    
+    def __init__(self, name: str, description: str, load_agent: Callable[[], BaseAgent]):
+        BaseTool.__init__(self, name=name, description=description)
+        self.skip_summarization = False
+        self._load_agent = load_agent
+        # Set once the agent failed to import, so the toolset stops offering it
+        self.unavailable = False
+    
+    @property
+    def agent(self) -> Optional[BaseAgent]:
+        return self._load_agent()
+    
+    async def run_async(self, *, args: Dict[str, Any], tool_context: ToolContext) -> Any:
+        if self.agent is None:
+            # Tell the model instead of raising, which would fail the whole routed request
+            self.unavailable = True
+            return f"The {self.name} agent is currently unavailable."
+        return await super().run_async(args=args, tool_context=tool_context)
+    
+    def _get_declaration(self) -> types.FunctionDeclaration:
+        # The declaration AgentTool builds for agents without an input_schema,
+        # from the static description so that routing does not import the agent
+        return types.FunctionDeclaration(
+            parameters=types.Schema(
+                type=types.Type.OBJECT,
+                properties={"request": types.Schema(type=types.Type.STRING)},
+                required=["request"],
+            ),
+            description=self.description,
+            name=self.name,
+        )
+
+# (display name, agents/ directory, package, agent attribute, description given to the router)
+_SPECIALIZED_AGENTS = (
+    (
+        "Academic Research",
+        "academic-research",
+        "academic_research",
+        "academic_coordinator",
+        "Analyzes seminal papers, finds recent citing publications, suggests new "
+        "research directions and gives academic research advice.",
+    ),
+    (
+        "FOMC Research",
+        "fomc-research",
+        "fomc_research",
+        "fomc_research_agent",
+        "Generates an analysis report about the most recent FOMC meeting, "
+        "Federal Reserve rate decisions and their market impact.",
+    ),
+    (
+        "Political News",
+        "political-news",
+        "political_news",
+        "political_news_coordinator",
+        "Scrapes and analyzes unbiased political news from the last 24 hours, "
+        "checks the articles for bias and summarizes them.",
+    ),
+)
+
+@functools.cache
+def _get_specialized_tools() -> Tuple[Tuple[str, _LazyAgentTool], ...]:
+    """Find the specialized agent packages and build a lazy tool for each one present.
+    
+    Runs on the first model request (or first AGENTS_AVAILABLE lookup) rather
+    than at import, so importing this module does no sys.path or filesystem work.
+    """
+    agents_dir = Path(__file__).resolve().parents[2]  # routing_agent -> routing_agent -> agents
+    tools = []
+    for display_name, dir_name, module_name, attr, description in _SPECIALIZED_AGENTS:
+        agent_path = agents_dir / dir_name
+        if agent_path.is_dir() and str(agent_path) not in sys.path:
+            sys.path.insert(0, str(agent_path))
+        # Only check that the package can be found; importing it waits for first use
+        if importlib.util.find_spec(module_name) is None:
+            logger.warning("%s Agent not found; it will not be available for routing", display_name)
+            continue
+        tools.append((display_name, _LazyAgentTool(attr, description, _agent_loader(module_name, attr))))
+    
+    if tools:
+        logger.info("Specialized agents available for routing: %s", ", ".join(name for name, _ in tools))
+    else:
+        logger.warning("No specialized agents are available; routing will have limited functionality")
+    return tuple(tools)
+
+def _available_tools() -> Tuple[Tuple[str, _LazyAgentTool], ...]:
+    """The specialized agent tools, minus any whose agent has failed to import."""
+    return tuple((name, tool) for name, tool in _get_specialized_tools() if not tool.unavailable)
+
+class _SpecializedAgentsToolset(BaseToolset):
+    """Hands the routing agent its specialized agent tools, resolved on first request."""
+    
+    async def get_tools(self, readonly_context: Optional[ReadonlyContext] = None) -> List[BaseTool]:
+        return [tool for _, tool in _available_tools()]
+    
+    async def close(self) -> None:
+        pass
+
+def __getattr__(name: str):
+    # Computed on first access so that importing the module stays cheap
+    if name == "available_agents":
+        return [display_name for display_name, _ in _available_tools()]
+    if name == "AGENTS_AVAILABLE":
+        return len(_available_tools()) >= 2
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 routing_agent = LlmAgent(
     name="routing_agent",
@@ -132,9 +198,11 @@ routing_agent = LlmAgent(
         "A routing agent that analyzes user requests and directs them to the appropriate "
         "specialized agent - academic research, FOMC financial analysis, or political news."
     ),
-    instruction=prompt.ROUTING_AGENT_PROMPT,
+    # A provider bypasses ADK's {state} templating, so the system instruction is
+    # byte-identical on every call and stays eligible for Gemini prefix caching
+    instruction=lambda _context: prompt.ROUTING_AGENT_PROMPT,
     output_key="routed_response",
-    tools=tools,
+    tools=[_SpecializedAgentsToolset()],
 )
 
 root_agent = routing_agent 
\ No newline at end of file
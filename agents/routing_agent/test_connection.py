@@ -26,7 +26,7 @@ def test_agent_connection():
     try:
         # Test routing agent import
         print("1. Testing routing agent import...")
-        from routing_agent.agent import routing_agent, AGENTS_AVAILABLE
+        from routing_agent.agent import routing_agent, AGENTS_AVAILABLE, available_agents
         print("   ✅ Routing agent imported successfully")
         
         # Test specialized agents availability
@@ -56,10 +56,10 @@ def test_agent_connection():
             
             # Test routing agent tools
             print("\n5. Testing routing agent tools...")
-            tools = routing_agent.tools
-            print(f"   📋 Number of tools available: {len(tools)}")
-            for i, tool in enumerate(tools):
-                print(f"   📋 Tool {i+1}: {tool.agent.name if hasattr(tool, 'agent') else 'Unknown'}")
+            # routing_agent.tools is one lazy toolset, so list the agents it wraps
+            print(f"   📋 Number of tools available: {len(available_agents)}")
+            for i, agent_name in enumerate(available_agents):
+                print(f"   📋 Tool {i+1}: {agent_name}")
             
         else:
             print("   ❌ Specialized agents are not available")
@@ -90,6 +90,13 @@ def test_agent_connection():
         print(f"❌ Unexpected error: {e}")
         return False
 
+# (label, short label, directory under agents/, package name)
+_SPECIALIZED_AGENT_DIRS = (
+    ("Academic Research", "Academic", "academic-research", "academic_research"),
+    ("FOMC Research", "FOMC", "fomc-research", "fomc_research"),
+    ("Political News", "Political", "political-news", "political_news"),
+)
+
 def show_directory_structure():
     """Show the current directory structure."""
     print("\n📁 Current Directory Structure:")
@@ -103,32 +110,27 @@ def show_directory_structure():
     print(f"Backend directory: {backend_dir}")
     print(f"Agents directory: {agents_dir}")
     
-    # Check for specialized agents in the agents folder
-    academic_path = agents_dir / "academic-research"
-    fomc_path = agents_dir / "fomc-research"
-    political_path = agents_dir / "political-news"
-    
-    print(f"\nAcademic Research: {'✅' if academic_path.exists() else '❌'} {academic_path}")
-    print(f"FOMC Research: {'✅' if fomc_path.exists() else '❌'} {fomc_path}")
-    print(f"Political News: {'✅' if political_path.exists() else '❌'} {political_path}")
-    
-    if academic_path.exists():
-        agent_file = academic_path / "academic_research" / "academic_research" / "agent.py"
-        init_file = academic_path / "academic_research" / "__init__.py"
-        print(f"  Academic agent.py: {'✅' if agent_file.exists() else '❌'} {agent_file}")
-        print(f"  Academic __init__.py: {'✅' if init_file.exists() else '❌'} {init_file}")
+    # Check for specialized agents in the agents folder, stat'ing each path once
+    agent_paths = []
+    for label, short_label, dir_name, package in _SPECIALIZED_AGENT_DIRS:
+        agent_path = agents_dir / dir_name
+        agent_paths.append((label, short_label, agent_path,
+                            agent_path / package / package / "agent.py",
+                            agent_path / package / "__init__.py"))
+    checks = {
+        path: path.exists()
+        for _, _, agent_path, agent_file, init_file in agent_paths
+        for path in (agent_path, agent_file, init_file)
+    }
     
-    if fomc_path.exists():
-        agent_file = fomc_path / "fomc_research" / "fomc_research" / "agent.py"
-        init_file = fomc_path / "fomc_research" / "__init__.py"
-        print(f"  FOMC agent.py: {'✅' if agent_file.exists() else '❌'} {agent_file}")
-        print(f"  FOMC __init__.py: {'✅' if init_file.exists() else '❌'} {init_file}")
+    print()
+    for label, _, agent_path, _, _ in agent_paths:
+        print(f"{label}: {'✅' if checks[agent_path] else '❌'} {agent_path}")
     
-    if political_path.exists():
-        agent_file = political_path / "political_news" / "political_news" / "agent.py"
-        init_file = political_path / "political_news" / "__init__.py"
-        print(f"  Political agent.py: {'✅' if agent_file.exists() else '❌'} {agent_file}")
-        print(f"  Political __init__.py: {'✅' if init_file.exists() else '❌'} {init_file}")
+    for _, short_label, agent_path, agent_file, init_file in agent_paths:
+        if checks[agent_path]:
+            print(f"  {short_label} agent.py: {'✅' if checks[agent_file] else '❌'} {agent_file}")
+            print(f"  {short_label} __init__.py: {'✅' if checks[init_file] else '❌'} {init_file}")
 
 if __name__ == "__main__":
     print("🚀 Testing Routing Agent Connection")
@@ -48,7 +48,7 @@ print("\n🧪 Testing routing agent import...")
 
 # Test routing agent import (this should work even if specialized agents fail)
 try:
-    from routing_agent.agent import routing_agent, AGENTS_AVAILABLE
+    from routing_agent.agent import routing_agent, AGENTS_AVAILABLE, available_agents
     print("✅ Successfully imported routing_agent")
     print(f"   Name: {routing_agent.name}")
     print(f"   Description: {routing_agent.description}")
@@ -56,10 +56,10 @@ try:
     
     if AGENTS_AVAILABLE:
         print("   ✅ Specialized agents are available")
-        print(f"   📋 Number of tools: {len(routing_agent.tools)}")
-        for i, tool in enumerate(routing_agent.tools):
-            if hasattr(tool, 'agent') and tool.agent:
-                print(f"   📋 Tool {i+1}: {tool.agent.name}")
+        # routing_agent.tools is one lazy toolset, so list the agents it wraps
+        print(f"   📋 Number of tools: {len(available_agents)}")
+        for i, agent_name in enumerate(available_agents):
+            print(f"   📋 Tool {i+1}: {agent_name}")
     else:
         print("   ⚠️  Specialized agents are not available")
         print("   💡 This may be due to missing API keys or authentication issues")
@@ -1,4 +1,4 @@
-from pydantic import BaseModel, Field, EmailStr
+from pydantic import BaseModel, ConfigDict, Field, EmailStr
 from typing import List, Optional, Dict, Any
 from database.schemas import VideoStatus
 from datetime import datetime
@@ -56,9 +56,9 @@ class VideoOut(VideoBase):
     user_id: str
     created_at: Optional[datetime] = None
 
-
-    class Config:
-        from_attributes = True
+    # Read-only output model: freeze it and build the core schema eagerly so the
+    # first list response doesn't pay for schema construction.
+    model_config = ConfigDict(from_attributes=True, frozen=True, defer_build=False)
 
 # Instagram Account schemas
 class InstagramAccountBase(BaseModel):
@@ -85,8 +85,7 @@ class InstagramAccountOut(InstagramAccountBase):
     media_count: int
     session_data: Optional[str] = None
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, frozen=True, defer_build=False)
 
 class InstagramAccountInfo(BaseModel):
     username: str
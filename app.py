@@ -2,12 +2,13 @@ import os
 from typing import Optional, List
 from dotenv import load_dotenv
 from fastapi import FastAPI, HTTPException, Depends, UploadFile, File
-from fastapi.responses import FileResponse
+from fastapi.responses import FileResponse, Response, StreamingResponse
 from beanie import init_beanie, PydanticObjectId
+from pydantic import TypeAdapter
 from database.schemas import Video, InstagramAccount, User, VideoStatus
 from managers.instagram_manager import InstagramManager
-from managers.vid_generator import generate, give_captions_and_tags
-from managers.chat_manager_clean import chat_manager
+from managers.vid_generator import close_http_session, generate, give_captions_and_tags
+from managers.chat_manager import chat_manager
 from api.schemas import (
     InstagramAccountCreate, InstagramAccountOut, AccountListResponse,
     VideoOut, VideoUpdate, VideoGenerationRequest, 
@@ -23,6 +24,7 @@ from apscheduler.triggers.interval import IntervalTrigger
 from pathlib import Path
 from datetime import datetime
 import logging
+import orjson
 
 load_dotenv()
 
@@ -30,6 +32,10 @@ scheduler = AsyncIOScheduler()
 instagram_manager = InstagramManager()
 logger = logging.getLogger(__name__)
 
+# Serializes the whole video list in one pass instead of letting FastAPI
+# re-validate and re-encode every VideoOut through response_model.
+_video_list_adapter = TypeAdapter(List[VideoOut])
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     # Startup: Initialize MongoDB connection and Beanie
@@ -48,8 +54,9 @@ async def lifespan(app: FastAPI):
     )
     
     yield
-    # Shutdown: Close scheduler and MongoDB connection
+    # Shutdown: Close scheduler, HTTP and MongoDB connections
     scheduler.shutdown()
+    await close_http_session()
     client.close()
 
 # Create FastAPI instance
@@ -66,10 +73,10 @@ app.add_middleware(
         "http://localhost:8080",
         "http://localhost:4173",
         "https://getreals.club",
-        "https://getrealsclub.vercel.app/",
+        "https://getrealsclub.vercel.app",
     ],
     allow_credentials=True,
-    allow_methods=["*"],
+    allow_methods=["GET", "POST", "PUT", "DELETE"],
     allow_headers=["*"],
 )
 
@@ -79,25 +86,13 @@ async def chat_endpoint(request: ChatRequest):
     Chat endpoint that routes messages to appropriate specialized agents.
     """
     try:
-        # Process the message using the chat manager
-        result = await chat_manager.process_chat_message(
+        # The chat manager already returns the ChatResponse field set
+        return await chat_manager.process_chat_message(
             message=request.message,
             user_id=request.user_id,
             session_id=request.session_id
         )
         
-        # Return the response
-        return ChatResponse(
-            success=result["success"],
-            message=result["message"],
-            response=result["response"],
-            agent_used=result["agent_used"],
-            routing_reason=result["routing_reason"],
-            timestamp=result["timestamp"],
-            session_id=result.get("session_id"),
-            tool_calls=result.get("tool_calls", [])
-        )
-        
     except Exception as e:
         logger.error(f"Error in chat endpoint: {e}")
         return ChatResponse(
@@ -109,6 +104,25 @@ async def chat_endpoint(request: ChatRequest):
             timestamp=datetime.now().isoformat()
         )
 
+@app.post("/chat/stream")
+async def chat_stream_endpoint(request: ChatRequest):
+    """
+    Streaming variant of /chat using Server-Sent Events.
+    
+    Sends a "routing" event once the specialized agent is chosen, "token" events
+    as response text arrives and a final "done" (or "error") event carrying the
+    same fields /chat returns.
+    """
+    async def event_stream():
+        async for event, data in chat_manager.stream_chat_message(
+            message=request.message,
+            user_id=request.user_id,
+            session_id=request.session_id
+        ):
+            yield b"event: " + event.encode() + b"\ndata: " + orjson.dumps(data) + b"\n\n"
+    
+    return StreamingResponse(event_stream(), media_type="text/event-stream")
+
 @app.get("/chat/agents")
 async def get_available_agents():
     """
@@ -308,7 +322,7 @@ async def list_videos():
                 insta_acc_id=str(insta_acc) if insta_acc else "",
                 user_id=str(user) if user else ""
             ))
-        return result
+        return Response(content=_video_list_adapter.dump_json(result), media_type="application/json")
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to list videos: {str(e)}")
 
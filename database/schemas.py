@@ -1,6 +1,6 @@
 import pathlib
 from beanie import Document, Link, Indexed
-from pydantic import Field, EmailStr
+from pydantic import BaseModel, Field, EmailStr
 from typing import List, Optional
 from datetime import datetime
 from bson import ObjectId
@@ -61,6 +61,10 @@ class InstagramAccount(Document):
             ObjectId: str,
         }
 
+# Projection for queries that only need account usernames
+class InstagramUsername(BaseModel):
+    username: str
+
 # User model
 class User(Document):
     username: str = Field(..., min_length=3, max_length=50, description="Unique username")
@@ -1,9 +1,17 @@
 import os
+import string
 import sys
+import time
 import logging
 import asyncio
+import functools
+import importlib.util
+from collections import OrderedDict
+from functools import cached_property
+from datetime import datetime
 from pathlib import Path
-from typing import Dict, Any, Optional
+from types import MappingProxyType
+from typing import AsyncIterator, Dict, Any, Optional, Tuple
 from dotenv import load_dotenv
 
 # Load environment variables
@@ -11,40 +19,229 @@ load_dotenv()
 
 logger = logging.getLogger(__name__)
 
+# Resolved and stat'ed once at import; ChatManager instances reuse these
+# instead of rebuilding the path and hitting the filesystem on every init.
+_ROUTING_AGENT_DIR = Path(__file__).resolve().parent.parent / "agents" / "routing_agent"
+_ROUTING_AGENT_PACKAGE_DIR = _ROUTING_AGENT_DIR / "routing_agent"
+_ROUTING_AGENT_EXISTS = _ROUTING_AGENT_DIR.is_dir()
+
+
+def _load_routing_agent_package():
+    """Import the routing_agent package from its directory without touching sys.path."""
+    package = sys.modules.get("routing_agent")
+    if package is None:
+        spec = importlib.util.spec_from_file_location(
+            "routing_agent",
+            _ROUTING_AGENT_PACKAGE_DIR / "__init__.py",
+            submodule_search_locations=[str(_ROUTING_AGENT_PACKAGE_DIR)],
+        )
+        package = importlib.util.module_from_spec(spec)
+        # Registered before executing so the package's relative imports resolve
+        sys.modules["routing_agent"] = package
+        try:
+            spec.loader.exec_module(package)
+        except BaseException:
+            del sys.modules["routing_agent"]
+            raise
+    return package
+
+# Simulation-mode routing keywords, in priority order: when a message hits
+# keywords from several categories the earliest category wins.
+_ROUTING_KEYWORDS = (
+    ("academic", ("research", "paper", "academic", "study", "analysis", "literature")),
+    ("fomc", ("fed", "fomc", "federal reserve", "interest rate", "monetary policy", "economic policy")),
+    ("political", ("news", "political", "politics", "election", "government", "policy", "current events")),
+)
+
+# Single-word keywords are matched as whole tokens ("fed" no longer fires on
+# "federation").
+_CATEGORY_WORDS = tuple(
+    (category, frozenset(keyword for keyword in keywords if " " not in keyword))
+    for category, keywords in _ROUTING_KEYWORDS
+)
+
+def _build_phrase_anchors() -> Dict[str, Tuple[Tuple[str, int], ...]]:
+    """Key multi-word phrases by their first word: {"federal": (("reserve", 1),), ...}."""
+    anchors: Dict[str, Tuple[Tuple[str, int], ...]] = {}
+    for priority, (_, keywords) in enumerate(_ROUTING_KEYWORDS):
+        for keyword in keywords:
+            if " " in keyword:
+                anchor, rest = keyword.split(" ", 1)
+                anchors[anchor] = anchors.get(anchor, ()) + ((rest, priority),)
+    return anchors
+
+# A phrase is only checked where its first word occurs as a whole token.
+_PHRASE_ANCHORS = _build_phrase_anchors()
+
+# Lowercases ASCII letters and blanks out punctuation and digits in one C-level
+# pass, so a plain split() yields the keyword tokens.
+_SEPARATORS = string.punctuation + string.digits
+_NORMALIZE_TABLE = str.maketrans(
+    string.ascii_uppercase + _SEPARATORS,
+    string.ascii_lowercase + " " * len(_SEPARATORS),
+)
+
+
+def _normalize_message(message: str) -> str:
+    """Lowercase a message and collapse it to single-space-separated words."""
+    return " ".join(message.translate(_NORMALIZE_TABLE).split())
+
+
+@functools.lru_cache(maxsize=2048)
+def _match_category(normalized: str) -> Optional[str]:
+    """Return the highest-priority keyword category found in the message.
+
+    Takes the output of _normalize_message and is cached on it, so repeated
+    prompts skip the keyword scan entirely.
+    """
+    words = normalized.split(" ")
+    tokens = set(words)
+    phrase_hits = set()
+    if not tokens.isdisjoint(_PHRASE_ANCHORS):
+        offset = 0
+        for word in words:
+            offset += len(word) + 1
+            for rest, priority in _PHRASE_ANCHORS.get(word, ()):
+                # startswith keeps inflections matching ("interest rates")
+                if normalized.startswith(rest, offset):
+                    phrase_hits.add(priority)
+    for priority, (category, keywords) in enumerate(_CATEGORY_WORDS):
+        if priority in phrase_hits or not tokens.isdisjoint(keywords):
+            return category
+    return None
+
+# Canned simulation-mode replies, built once and frozen; callers take a copy
+# and fill in the timestamp.
+# Every reply carries the full ChatResponse field set so the API layer can
+# return it without re-wrapping.
+_SIMULATED_RESPONSES = {
+    "academic": MappingProxyType({
+        "success": True,
+        "message": "Message processed successfully (simulation mode)",
+        "response": "I'll route this to our Academic Research Agent. This agent specializes in research analysis, literature reviews, and academic guidance.",
+        "agent_used": "academic_coordinator",
+        "routing_reason": "Academic research keywords detected (simulation)",
+        "tool_calls": (),
+        "session_id": None,
+    }),
+    "fomc": MappingProxyType({
+        "success": True,
+        "message": "Message processed successfully (simulation mode)",
+        "response": "I'll route this to our FOMC Research Agent. This agent specializes in Federal Reserve analysis, monetary policy research, and economic insights.",
+        "agent_used": "fomc_research_agent",
+        "routing_reason": "FOMC/economic policy keywords detected (simulation)",
+        "tool_calls": (),
+        "session_id": None,
+    }),
+    "political": MappingProxyType({
+        "success": True,
+        "message": "Message processed successfully (simulation mode)",
+        "response": "I'll route this to our Political News Agent. This agent specializes in gathering and analyzing political news from multiple sources with bias detection.",
+        "agent_used": "political_news_coordinator",
+        "routing_reason": "Political news keywords detected (simulation)",
+        "tool_calls": (),
+        "session_id": None,
+    }),
+}
+
+_DEFAULT_SIMULATED_RESPONSE = MappingProxyType({
+    "success": True,
+    "message": "Message processed successfully (simulation mode)",
+    "response": "I'm here to help! I can assist with academic research, FOMC analysis, political news, or general questions. What would you like to know?",
+    "agent_used": "general_assistant",
+    "routing_reason": "General query (simulation)",
+    "tool_calls": (),
+    "session_id": None,
+})
+
+_ADK_SUCCESS_RESPONSE = MappingProxyType({
+    "success": True,
+    "message": "Message processed successfully via ADK routing",
+})
+
+_ERROR_RESPONSE = MappingProxyType({
+    "success": False,
+    "response": "I apologize, but I encountered an error processing your request.",
+    "agent_used": "error",
+    "routing_reason": "Error occurred",
+    "tool_calls": (),
+    "session_id": None,
+})
+
+# When no tool call names the target agent, infer it from the reply text.
+# Scanned in order against a single lowered copy; the first marker found wins.
+_RESPONSE_MARKERS = (
+    ("academic", "academic_coordinator", "Academic agent referenced in ADK response"),
+    ("fomc", "fomc_research_agent", "FOMC agent referenced in ADK response"),
+    ("federal", "fomc_research_agent", "FOMC agent referenced in ADK response"),
+    ("political", "political_news_coordinator", "Political news agent referenced in ADK response"),
+)
+
+# Bounds for ADK sessions kept alive between turns of a caller conversation.
+_SESSION_CACHE_MAXSIZE = 5000
+_SESSION_TTL_SECONDS = 300
+
+# [second, isoformat] of the last stamped response; replies within the same
+# second share one string instead of formatting a fresh datetime each time.
+_timestamp_cache = [0, ""]
+
+# Specialized agents the router can hand a message to (simulated or real).
+_AVAILABLE_AGENTS = ("academic_coordinator", "fomc_research_agent", "political_news_coordinator")
+
 class ChatManager:
     """Manages chat interactions with the ADK routing agent."""
     
+    # The loaded routing agent and its runner, shared so later instances skip
+    # the import and every instance sees the same InMemorySessionService
+    _shared_routing_agent = None
+    _shared_runner = None
+    
     def __init__(self):
         self.routing_agent_path = None
-        self.routing_agent = None
-        self._initialize_routing_agent()
+        # In-flight session-less ADK runs keyed by (message, user_id)
+        self._inflight: Dict[Tuple[str, Optional[str]], asyncio.Future] = {}
+        # (user_id, session_id) -> last used, oldest first
+        self._sessions: "OrderedDict[Tuple[str, str], float]" = OrderedDict()
+    
+    @cached_property
+    def routing_agent(self):
+        """The ADK routing agent, imported on first use; None means simulation mode."""
+        return self._initialize_routing_agent()
     
     def _initialize_routing_agent(self):
         """Initialize the routing agent from its proper directory."""
+        if ChatManager._shared_routing_agent is not None:
+            self.routing_agent_path = _ROUTING_AGENT_DIR
+            return ChatManager._shared_routing_agent
+        
         try:
-            # Find the routing agent directory
-            current_dir = Path(__file__).parent.parent
-            agents_dir = current_dir / "agents"
-            routing_agent_dir = agents_dir / "routing_agent"
-            
-            if routing_agent_dir.exists():
-                self.routing_agent_path = routing_agent_dir
-                
-                # Add routing agent directory to Python path
-                sys.path.insert(0, str(routing_agent_dir))
+            if _ROUTING_AGENT_EXISTS:
+                self.routing_agent_path = _ROUTING_AGENT_DIR
                 
                 # Import the routing agent
-                from routing_agent.agent import routing_agent
-                self.routing_agent = routing_agent
+                agent_module = _load_routing_agent_package().agent
+                routing_agent = agent_module.routing_agent
+                ChatManager._shared_routing_agent = routing_agent
                 
-                logger.info(f"✅ Routing agent loaded from: {self.routing_agent_path}")
-                logger.info(f"✅ Available tools: {[tool.name if hasattr(tool, 'name') else 'Unknown' for tool in self.routing_agent.tools]}")
+                logger.info("✅ Routing agent loaded from: %s", self.routing_agent_path)
+                if logger.isEnabledFor(logging.INFO):
+                    # The tools are one lazy toolset, so list the agents it wraps
+                    logger.info("✅ Available agents: %s", agent_module.available_agents)
+                return routing_agent
             else:
                 logger.warning("⚠️ Routing agent directory not found, using simulation mode")
                 
         except Exception as e:
-            logger.error(f"❌ Error loading routing agent: {e}")
+            logger.error("❌ Error loading routing agent: %s", e)
             logger.info("🔄 Falling back to simulation mode")
+        
+        return None
+    
+    def warm_up(self) -> None:
+        """Load the routing agent and build its runner now instead of on the first message."""
+        if self.routing_agent is not None:
+            # Reading the cached_property is what builds and stores the runner
+            _ = self._runner
     
     async def process_chat_message(self, message: str, user_id: str = None, session_id: str = None) -> Dict[str, Any]:
         """
@@ -58,162 +255,261 @@ class ChatManager:
         Returns:
             Dictionary containing the response and metadata
         """
+        if self.routing_agent is None:
+            # Simulation mode is pure CPU work; no coroutine or error guard needed
+            return self._simulate_routing(message)
+        
+        if session_id is not None:
+            return await self._route(message, user_id, session_id)
+        
+        # Identical session-less messages already in flight share one ADK run;
+        # shield keeps a cancelled caller from cancelling it for the others.
+        key = (message, user_id)
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._route(message, user_id, None))
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+        shared = await asyncio.shield(task)
+        # Every coalesced caller gets its own dict and tool_calls list
+        result = dict(shared)
+        if "tool_calls" in result:
+            result["tool_calls"] = list(result["tool_calls"])
+        return result
+    
+    async def _route(self, message: str, user_id: Optional[str], session_id: Optional[str]) -> Dict[str, Any]:
+        """Run the ADK routing agent, turning unexpected failures into an error response."""
         try:
-            if self.routing_agent is None:
-                # Fallback to simulation mode
-                return await self._simulate_routing(message, user_id)
+            return await self._run_routing_agent(message, user_id, session_id)
+        except Exception as e:
+            logger.error("❌ Error in process_chat_message: %s", e)
+            result = _ERROR_RESPONSE.copy()
+            result["message"] = f"Error processing message: {str(e)}"
+            result["timestamp"] = self._get_timestamp()
+            return result
+    
+    async def stream_chat_message(self, message: str, user_id: str = None,
+                                  session_id: str = None) -> AsyncIterator[Tuple[str, Dict[str, Any]]]:
+        """
+        Process a chat message, yielding (event, data) pairs as the reply is produced.
+        
+        Yields "routing" when a specialized agent is chosen, "token" for each chunk
+        of response text and finally "done" (or "error") with the same fields
+        process_chat_message returns.
+        """
+        if self.routing_agent is None:
+            result = self._simulate_routing(message)
+            yield "routing", {"agent_used": result["agent_used"], "routing_reason": result["routing_reason"]}
+            yield "token", {"text": result["response"]}
+            yield "done", result
+            return
+        
+        try:
+            async for item in self._iter_routing_agent(message, user_id, session_id, streaming=True):
+                yield item
+        except Exception as e:
+            logger.error("❌ Error in stream_chat_message: %s", e)
+            result = _ERROR_RESPONSE.copy()
+            result["message"] = f"Error processing message: {str(e)}"
+            result["timestamp"] = self._get_timestamp()
+            yield "error", result
+    
+    async def _run_routing_agent(self, message: str, user_id: str = None, session_id: str = None) -> Dict[str, Any]:
+        """Run the message through the ADK routing agent, falling back to simulation."""
+        result = None
+        async for event, data in self._iter_routing_agent(message, user_id, session_id):
+            if event == "done":
+                result = data
+        return result
+    
+    async def _iter_routing_agent(self, message: str, user_id: Optional[str], session_id: Optional[str],
+                                  streaming: bool = False) -> AsyncIterator[Tuple[str, Dict[str, Any]]]:
+        """Drive one ADK run, yielding routing/token events and then the final "done" result."""
+        # Use the ADK routing agent directly
+        try:
+            logger.debug("🚀 Using ADK routing agent...")
             
-            # Use the ADK routing agent directly
-            try:
-                logger.debug("🚀 Using ADK routing agent...")
-                
-                # Import ADK components
-                from google.adk.runners import InMemoryRunner
-                from google.genai import types
-                
-                # Create a runner for the routing agent
-                runner = InMemoryRunner(agent=self.routing_agent, app_name="routing_agent")
-                
-                # Create or use existing session
-                if session_id:
-                    try:
-                        session = await runner.session_service.get_session(
-                            app_name=runner.app_name, 
-                            user_id=user_id or "default_user",
-                            session_id=session_id
-                        )
-                    except:
-                        session = await runner.session_service.create_session(
-                            app_name=runner.app_name, 
-                            user_id=user_id or "default_user"
-                        )
-                else:
-                    session = await runner.session_service.create_session(
-                        app_name=runner.app_name, 
-                        user_id=user_id or "default_user"
-                    )
-                
-                # Create content for the message
-                content = types.Content(parts=[types.Part(text=message)])
+            # Import ADK components
+            from google.adk.agents.run_config import RunConfig, StreamingMode
+            from google.genai import types
+            
+            runner = self._runner
+            user_id = user_id or "default_user"
+            
+            # Caller conversations keep their ADK session across turns;
+            # session-less requests get a one-off session
+            if session_id:
+                await self._acquire_session(runner, user_id, session_id)
+                adk_session_id = session_id
+            else:
+                session = await runner.session_service.create_session(
+                    app_name=runner.app_name, 
+                    user_id=user_id
+                )
+                adk_session_id = session.id
+            
+            # Create content for the message
+            content = types.Content(parts=[types.Part(text=message)])
+            
+            # Run the agent and collect response; chunks are joined once at the end
+            response_parts = []
+            agent_used = "routing_agent"
+            routing_reason = "Dynamic routing via ADK"
+            tool_calls_made = []
+            # Checked once so the per-event debug arguments cost nothing in production
+            debug_events = logger.isEnabledFor(logging.DEBUG)
+            # In SSE mode ADK sends partial text events ahead of each aggregated
+            # one; tokens come from the partials and the aggregate is not re-sent
+            run_config = RunConfig(streaming_mode=StreamingMode.SSE if streaming else StreamingMode.NONE)
+            streamed = False
+            
+            async for event in runner.run_async(
+                user_id=user_id,
+                session_id=adk_session_id,
+                new_message=content,
+                run_config=run_config,
+            ):
+                if debug_events:
+                    logger.debug("📡 ADK Event: author=%s type=%s final=%s",
+                                 event.author, type(event).__name__, event.is_final_response())
+                    # The routing prompt is a fixed prefix, so Gemini's implicit
+                    # context cache should serve most of each request's prompt
+                    usage = event.usage_metadata
+                    if usage is not None and usage.prompt_token_count:
+                        logger.debug("🗄️ Prompt tokens: %d (cached: %d)",
+                                     usage.prompt_token_count, usage.cached_content_token_count or 0)
                 
-                # Run the agent and collect response
-                response_content = ""
-                agent_used = "routing_agent"
-                routing_reason = "Dynamic routing via ADK"
-                tool_calls_made = []
+                # ADK streams one concrete Event type: content and parts are
+                # typed (possibly None) fields, so read them directly
+                event_content = event.content
+                if event_content is not None and event_content.parts:
+                    texts = [part.text for part in event_content.parts if part.text]
+                    if not event.partial:
+                        response_parts.extend(texts)
+                    if event.partial or not streamed:
+                        for text in texts:
+                            yield "token", {"text": text}
+                    streamed = bool(event.partial)
                 
-                async for event in runner.run_async(
-                    user_id=session.user_id,
-                    session_id=session.id,
-                    new_message=content,
-                ):
-                    logger.debug(f"📡 ADK Event: {type(event)}")
-                    
-                    # Extract response from event
-                    if hasattr(event, 'content') and event.content:
-                        if hasattr(event.content, 'parts') and event.content.parts:
-                            for part in event.content.parts:
-                                if hasattr(part, 'text') and part.text:
-                                    response_content += part.text
-                        elif hasattr(event.content, 'text'):
-                            response_content += event.content.text
-                    
-                    # Check if this is a tool call event (agent routing decision)
-                    if hasattr(event, 'tool_calls') and event.tool_calls:
-                        for tool_call in event.tool_calls:
-                            if hasattr(tool_call, 'name'):
-                                tool_calls_made.append(tool_call.name)
-                                agent_used = tool_call.name
-                                routing_reason = f"Routed to {agent_used} via ADK tool call"
-                                logger.info(f"🎯 ADK routed to: {agent_used}")
-                    
-                    # Check for tool results
-                    if hasattr(event, 'tool_results') and event.tool_results:
-                        for tool_result in event.tool_results:
-                            if hasattr(tool_result, 'content') and tool_result.content:
-                                if hasattr(tool_result.content, 'parts') and tool_result.content.parts:
-                                    for part in tool_result.content.parts:
-                                        if hasattr(part, 'text') and part.text:
-                                            response_content += part.text
-                                elif hasattr(tool_result.content, 'text'):
-                                    response_content += tool_result.content.text
+                # Function calls are the agent routing decisions (AgentTool names)
+                for tool_call in event.get_function_calls():
+                    tool_calls_made.append(tool_call.name)
+                    agent_used = tool_call.name
+                    routing_reason = f"Routed to {agent_used} via ADK tool call"
+                    logger.info("🎯 ADK routed to: %s", agent_used)
+                    yield "routing", {"agent_used": agent_used, "routing_reason": routing_reason}
                 
-                # Clean up session
+                # The runner has already recorded the final event in the session
+                if event.is_final_response():
+                    break
+            
+            response_content = "".join(response_parts)
+            
+            # Clean up one-off sessions; cached ones are evicted by _evict_sessions
+            if not session_id:
                 await runner.session_service.delete_session(
                     app_name=runner.app_name,
-                    user_id=session.user_id,
-                    session_id=session.id
+                    user_id=user_id,
+                    session_id=adk_session_id
                 )
+            
+            if response_content:
+                if not tool_calls_made:
+                    response_lc = response_content.lower()
+                    for marker, agent, reason in _RESPONSE_MARKERS:
+                        if marker in response_lc:
+                            agent_used, routing_reason = agent, reason
+                            break
                 
-                if response_content:
-                    return {
-                        "success": True,
-                        "message": "Message processed successfully via ADK routing",
-                        "response": response_content,
-                        "agent_used": agent_used,
-                        "routing_reason": routing_reason,
-                        "tool_calls": tool_calls_made,
-                        "session_id": session.id,
-                        "timestamp": self._get_timestamp()
-                    }
-                else:
-                    logger.warning("⚠️ No response content from ADK routing agent, falling back to simulation")
-                    return await self._simulate_routing(message, user_id)
-                    
-            except Exception as e:
-                logger.error(f"❌ Error using ADK routing agent: {e}")
-                logger.info("🔄 Falling back to simulation mode")
-                return await self._simulate_routing(message, user_id)
+                result = _ADK_SUCCESS_RESPONSE.copy()
+                result["response"] = response_content
+                result["agent_used"] = agent_used
+                result["routing_reason"] = routing_reason
+                result["tool_calls"] = tool_calls_made
+                result["session_id"] = adk_session_id
+                result["timestamp"] = self._get_timestamp()
+                yield "done", result
+            else:
+                logger.warning("⚠️ No response content from ADK routing agent, falling back to simulation")
+                yield "done", self._simulate_routing(message)
                 
         except Exception as e:
-            logger.error(f"❌ Error in process_chat_message: {e}")
-            return {
-                "success": False,
-                "message": f"Error processing message: {str(e)}",
-                "response": "I apologize, but I encountered an error processing your request.",
-                "agent_used": "error",
-                "routing_reason": "Error occurred",
-                "timestamp": self._get_timestamp()
-            }
-    
-    async def _simulate_routing(self, message: str, user_id: str = None) -> Dict[str, Any]:
-        """Simulate routing logic when the actual routing agent is not available."""
-        message_lower = message.lower()
+            logger.error("❌ Error using ADK routing agent: %s", e)
+            logger.info("🔄 Falling back to simulation mode")
+            yield "done", self._simulate_routing(message)
+    
+    @cached_property
+    def _runner(self):
+        """The InMemoryRunner shared by every request, built on first ADK use."""
+        if ChatManager._shared_runner is None:
+            from google.adk.runners import InMemoryRunner
+            ChatManager._shared_runner = InMemoryRunner(agent=self.routing_agent, app_name="routing_agent")
+        return ChatManager._shared_runner
+    
+    async def _acquire_session(self, runner, user_id: str, session_id: str) -> None:
+        """Make sure an ADK session exists under the caller's own session id."""
+        now = time.monotonic()
+        await self._evict_sessions(runner, now)
         
-        # Simple keyword-based routing
-        if any(keyword in message_lower for keyword in ["research", "paper", "academic", "study", "analysis", "literature"]):
-            agent_used = "academic_coordinator"
-            routing_reason = "Academic research keywords detected (simulation)"
-            response = "I'll route this to our Academic Research Agent. This agent specializes in research analysis, literature reviews, and academic guidance."
-            
-        elif any(keyword in message_lower for keyword in ["fed", "fomc", "federal reserve", "interest rate", "monetary policy", "economic policy"]):
-            agent_used = "fomc_research_agent"
-            routing_reason = "FOMC/economic policy keywords detected (simulation)"
-            response = "I'll route this to our FOMC Research Agent. This agent specializes in Federal Reserve analysis, monetary policy research, and economic insights."
-            
-        elif any(keyword in message_lower for keyword in ["news", "political", "politics", "election", "government", "policy", "current events"]):
-            agent_used = "political_news_coordinator"
-            routing_reason = "Political news keywords detected (simulation)"
-            response = "I'll route this to our Political News Agent. This agent specializes in gathering and analyzing political news from multiple sources with bias detection."
-            
-        else:
-            agent_used = "general_assistant"
-            routing_reason = "General query (simulation)"
-            response = "I'm here to help! I can assist with academic research, FOMC analysis, political news, or general questions. What would you like to know?"
+        key = (user_id, session_id)
+        if self._sessions.pop(key, None) is None:
+            session = await runner.session_service.get_session(
+                app_name=runner.app_name,
+                user_id=user_id,
+                session_id=session_id
+            )
+            if session is None:
+                # Reusing the caller's id keeps one stable key per conversation,
+                # so every turn lands on the same session history
+                await runner.session_service.create_session(
+                    app_name=runner.app_name,
+                    user_id=user_id,
+                    session_id=session_id
+                )
         
-        return {
-            "success": True,
-            "message": "Message processed successfully (simulation mode)",
-            "response": response,
-            "agent_used": agent_used,
-            "routing_reason": routing_reason,
-            "timestamp": self._get_timestamp()
-        }
+        # Re-inserting keeps the OrderedDict in least-recently-used-first order
+        self._sessions[key] = now
+    
+    async def _evict_sessions(self, runner, now: float) -> None:
+        """Delete expired sessions and make room for one more below the cache bound."""
+        while self._sessions:
+            (user_id, session_id), last_used = next(iter(self._sessions.items()))
+            if len(self._sessions) < _SESSION_CACHE_MAXSIZE and now - last_used < _SESSION_TTL_SECONDS:
+                break
+            self._sessions.popitem(last=False)
+            await runner.session_service.delete_session(
+                app_name=runner.app_name,
+                user_id=user_id,
+                session_id=session_id
+            )
+    
+    def _simulate_routing(self, message: str) -> Dict[str, Any]:
+        """Simulate routing logic when the actual routing agent is not available."""
+        # Simple keyword-based routing
+        category = _match_category(_normalize_message(message))
+        result = _SIMULATED_RESPONSES.get(category, _DEFAULT_SIMULATED_RESPONSE).copy()
+        result["timestamp"] = self._get_timestamp()
+        return result
+    
+    def get_available_agents(self) -> tuple:
+        """Get the specialized agents messages can be routed to."""
+        return _AVAILABLE_AGENTS
+    
+    def is_available(self) -> bool:
+        """Check if the chat service is available (simulation mode always is)."""
+        return True
+    
+    def clear_routing_cache(self) -> None:
+        """Drop all cached simulation-mode routing decisions."""
+        _match_category.cache_clear()
     
     def _get_timestamp(self) -> str:
-        """Get current timestamp in ISO format."""
-        from datetime import datetime
-        return datetime.now().isoformat()
+        """Get current timestamp in ISO format, to whole-second resolution."""
+        now = int(time.time())
+        if now != _timestamp_cache[0]:
+            _timestamp_cache[0] = now
+            _timestamp_cache[1] = datetime.fromtimestamp(now).isoformat()
+        return _timestamp_cache[1]
 
 # Create a global instance
 chat_manager = ChatManager() 
\ No newline at end of file
@@ -1,24 +1,86 @@
-import json
-from typing import Dict, Optional, List
+import asyncio
+import time
+from collections import OrderedDict, defaultdict
+from typing import Dict, Optional, List, Tuple
 from pathlib import Path
+import orjson
+from pydantic import ValidationError
+from pymongo.errors import PyMongoError
+from requests import RequestException
+from requests.adapters import HTTPAdapter
 from instagrapi import Client
-from instagrapi.exceptions import LoginRequired, ChallengeRequired, PleaseWaitFewMinutes, RateLimitError
-from database.schemas import InstagramAccount
+from instagrapi.exceptions import ClientError, LoginRequired, ChallengeRequired, PleaseWaitFewMinutes, RateLimitError
+from database.schemas import InstagramAccount, InstagramUsername
 
+# Failures callers are told about; anything else is a bug and propagates.
+# instagrapi parses responses into pydantic models, hence ValidationError.
+_DB_ERRORS = (PyMongoError, ValidationError)
+_INSTAGRAM_ERRORS = (ClientError, RequestException, ValidationError)
+
+# Account documents are cached briefly so repeated uploads and stat refreshes
+# skip the MongoDB round trip; writes go to both the database and the cache.
+_ACCOUNT_CACHE_TTL_SECONDS = 120
+_ACCOUNT_CACHE_MAX_ENTRIES = 1000
+
+# Uploads per account allowed in flight at once; bursts queue instead of
+# racing each other into Instagram's rate limiter.
+_MAX_CONCURRENT_UPLOADS = 2
+
+def _dump_settings(settings: dict) -> str:
+    """Serialize instagrapi client settings for InstagramAccount.session_data."""
+    # OPT_NON_STR_KEYS matches json.dumps, which stringifies non-str keys
+    return orjson.dumps(settings, option=orjson.OPT_NON_STR_KEYS).decode()
+
+# One urllib3 pool shared by every client's private and public sessions, so a
+# freshly added or reloaded account reuses warm keep-alive connections
+_SHARED_HTTP_ADAPTER = HTTPAdapter(pool_connections=32, pool_maxsize=64)
+
+def _new_client() -> Client:
+    client = Client()
+    client.private.mount("https://", _SHARED_HTTP_ADAPTER)
+    client.public.mount("https://", _SHARED_HTTP_ADAPTER)
+    return client
+
+# instagrapi is synchronous and talks to Instagram over blocking HTTPS, so its
+# network calls run in worker threads via asyncio.to_thread to keep the event
+# loop free while a login or upload is in flight.
 class InstagramManager:
     def __init__(self):
         self.clients: Dict[str, Client] = {}
+        # username -> (account, fetched at), least recently used first
+        self._account_cache: "OrderedDict[str, Tuple[InstagramAccount, float]]" = OrderedDict()
+        self._upload_slots: Dict[str, asyncio.Semaphore] = defaultdict(lambda: asyncio.Semaphore(_MAX_CONCURRENT_UPLOADS))
+    
+    async def _find_account(self, username: str) -> Optional[InstagramAccount]:
+        now = time.monotonic()
+        cached = self._account_cache.get(username)
+        if cached is not None and now - cached[1] < _ACCOUNT_CACHE_TTL_SECONDS:
+            self._account_cache.move_to_end(username)
+            return cached[0]
+        
+        account = await InstagramAccount.find_one(InstagramAccount.username == username)
+        if account is None:
+            self._account_cache.pop(username, None)
+        else:
+            self._cache_account(account, now)
+        return account
+    
+    def _cache_account(self, account: InstagramAccount, now: Optional[float] = None) -> None:
+        self._account_cache[account.username] = (account, time.monotonic() if now is None else now)
+        self._account_cache.move_to_end(account.username)
+        while len(self._account_cache) > _ACCOUNT_CACHE_MAX_ENTRIES:
+            self._account_cache.popitem(last=False)
     
     async def add_account(self, username: str, password: str) -> tuple[bool, str]:
         try:
-            existing = await InstagramAccount.find_one(InstagramAccount.username == username)
+            existing = await self._find_account(username)
             if existing:
                 return False, "Account already exists"
             
-            client = Client()
+            client = _new_client()
             
             try:
-                client.login(username, password)
+                await asyncio.to_thread(client.login, username, password)
             except ChallengeRequired as e:
                 return False, "Instagram challenge required - please complete verification"
             except LoginRequired as e:
@@ -27,17 +89,17 @@ class InstagramManager:
                 return False, "Rate limited - please wait a few minutes"
             except RateLimitError as e:
                 return False, "Too many requests - please try again later"
-            except Exception as e:
+            except _INSTAGRAM_ERRORS as e:
                 return False, f"Login failed: {str(e)}"
             
             try:
-                user_info = client.user_info(str(client.user_id))
+                user_info = await asyncio.to_thread(client.user_info, str(client.user_id))
                 full_name = getattr(user_info, 'full_name', username)
                 bio = getattr(user_info, 'biography', '')
                 follower_count = getattr(user_info, 'follower_count', 0)
                 following_count = getattr(user_info, 'following_count', 0)
                 media_count = getattr(user_info, 'media_count', 0)
-            except Exception as e:
+            except _INSTAGRAM_ERRORS as e:
                 full_name = username
                 bio = ''
                 follower_count = 0
@@ -53,44 +115,45 @@ class InstagramManager:
                 follower_count=follower_count,
                 following_count=following_count,
                 media_count=media_count,
-                session_data=json.dumps(client.get_settings())
+                session_data=_dump_settings(client.get_settings())
             )
             
             await account.save()
             
+            self._cache_account(account)
             self.clients[username] = client
             return True, "Account added successfully"
             
-        except Exception as e:
+        except _DB_ERRORS as e:
             return False, f"Database error: {str(e)}"
     
     async def load_account(self, username: str) -> tuple[bool, str]:
         try:
-            account = await InstagramAccount.find_one(InstagramAccount.username == username)
+            account = await self._find_account(username)
             if not account:
                 return False, "Account not found"
             
             try:
-                client = Client()
+                client = _new_client()
                 session_data = account.session_data
                 if session_data is None:
                     return False, "No session data found"
-                settings = json.loads(session_data)
+                settings = orjson.loads(session_data)
                 client.set_settings(settings)
                 
                 try:
-                    client.account_info()
+                    await asyncio.to_thread(client.account_info)
                     self.clients[username] = client
                     return True, "Session loaded successfully"
                 except LoginRequired:
                     return False, "Session expired - please re-login"
                     
-            except json.JSONDecodeError as e:
+            except orjson.JSONDecodeError as e:
                 return False, "Invalid session data"
-            except Exception as e:
+            except _INSTAGRAM_ERRORS as e:
                 return False, f"Session restore failed: {str(e)}"
                 
-        except Exception as e:
+        except _DB_ERRORS as e:
             return False, f"Database error: {str(e)}"
         
     async def upload_video(self, username: str, video_path: str, caption: str = "") -> tuple[Optional[str], str]:
@@ -101,41 +164,45 @@ class InstagramManager:
         
         try:
             client = self.clients[username]
-            media = client.clip_upload(Path(video_path), caption)
+            async with self._upload_slots[username]:
+                media = await asyncio.to_thread(client.clip_upload, Path(video_path), caption)
             return str(media.id), "Video uploaded successfully"
         except LoginRequired as e:
             return None, "Session expired - please re-login"
         except RateLimitError as e:
             return None, "Rate limited - please try again later"
-        except Exception as e:
+        except (*_INSTAGRAM_ERRORS, OSError) as e:
             return None, f"Upload failed: {str(e)}"
 
     
     async def update_account_stats(self, username: str) -> bool:
         if username not in self.clients:
-            if not self.load_account(username):
+            success, _ = await self.load_account(username)
+            if not success:
                 return False
         
         try:
             client = self.clients[username]
-            user_info = client.user_info(str(client.user_id))
+            user_info = await asyncio.to_thread(client.user_info, str(client.user_id))
             
-            account = await InstagramAccount.find_one(InstagramAccount.username == username)
+            account = await self._find_account(username)
             if account:
+                # The cached document is updated in place, so later reads see the new stats
                 account.follower_count = user_info.follower_count
                 account.following_count = user_info.following_count
                 account.media_count = user_info.media_count
-                account.session_data = json.dumps(client.get_settings())
+                account.session_data = _dump_settings(client.get_settings())
                 await account.save()
+                self._cache_account(account)
                 return True
-        except Exception as e:
+        except (*_INSTAGRAM_ERRORS, *_DB_ERRORS) as e:
             print(f"Failed to update stats for {username}: {e}")
         
         return False
     
     async def get_account_info(self, username: str) -> Optional[dict]:
         try:
-            account = await InstagramAccount.find_one(InstagramAccount.username == username)
+            account = await self._find_account(username)
             if account:
                 return {
                     'username': account.username,
@@ -146,30 +213,32 @@ class InstagramManager:
                     'media_count': account.media_count,
                 }
             
-        except Exception as e:
+        except _DB_ERRORS as e:
             print(f"Failed to get info for {username}: {e}")
         
         return None
     
     async def list_accounts(self) -> List[str]:
         try:
-            accounts = await InstagramAccount.find().to_list()
+            # Project to the username so session blobs and bios never leave MongoDB
+            accounts = await InstagramAccount.find().project(InstagramUsername).to_list()
             return [account.username for account in accounts]
-        except Exception as e:
+        except _DB_ERRORS as e:
             print(f"Failed to list accounts: {e}")
             return []
     
     async def remove_account(self, username: str) -> bool:
         try:
-            account = await InstagramAccount.find_one(InstagramAccount.username == username)
+            account = await self._find_account(username)
             if account:
                 await account.delete()
+                self._account_cache.pop(username, None)
                 
                 if username in self.clients:
                     del self.clients[username]
                 
                 return True
-        except Exception as e:
+        except _DB_ERRORS as e:
             print(f"Failed to remove account {username}: {e}")
         
         return False
\ No newline at end of file
@@ -1,14 +1,21 @@
-import uuid
+import heapq
+import os
+import sqlite3
+from secrets import token_hex
 import time
-from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Any
-from dataclasses import dataclass, asdict
-import json
+from datetime import datetime
+from typing import Deque, Dict, List, Optional, Any, Tuple
+from collections import deque
+from contextlib import contextmanager
+from dataclasses import dataclass
+from itertools import islice
 import logging
+import orjson
+import threading
 
 logger = logging.getLogger(__name__)
 
-@dataclass
+@dataclass(slots=True)
 class ChatMessage:
     """Represents a single chat message in a conversation."""
     message_id: str
@@ -18,37 +25,275 @@ class ChatMessage:
     response: str
     agent_used: Optional[str]
     routing_reason: Optional[str]
-    timestamp: datetime
+    timestamp: float  # epoch seconds
     metadata: Dict[str, Any]
 
-@dataclass
+@dataclass(slots=True)
 class ChatSession:
     """Represents a chat session with conversation history."""
     session_id: str
     user_id: str
-    created_at: datetime
-    last_activity: datetime
+    created_at: float  # epoch seconds
+    last_activity: float  # epoch seconds
     message_count: int
     is_active: bool
     metadata: Dict[str, Any]
 
-class SessionManager:
-    """Manages chat sessions and conversation history."""
+# Number of independently locked session shards; a power of two so the shard
+# index is a bit mask of the session id's hash.
+_SHARD_COUNT = 64
+
+# The expiry sweeper wakes this often and removes at most this many expired
+# sessions per pass, so no single pass holds locks for long.
+_SWEEP_INTERVAL_SECONDS = 60
+_SWEEP_CHUNK_SIZE = 5000
+
+# Messages kept in memory per session; older ones fall off the front (they
+# remain in the SQLite store when one is attached).
+_MAX_MESSAGES_PER_SESSION = 1000
+
+# With a SQLite store attached, sessions idle this long are dropped from memory
+# (but kept on disk) and reloaded on their next use.
+_HOT_SESSION_IDLE_SECONDS = 15 * 60
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS sessions (
+    session_id TEXT PRIMARY KEY,
+    user_id TEXT NOT NULL,
+    created_at REAL NOT NULL,
+    last_activity REAL NOT NULL,
+    message_count INTEGER NOT NULL,
+    is_active INTEGER NOT NULL,
+    metadata TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS sessions_user_id ON sessions (user_id);
+CREATE INDEX IF NOT EXISTS sessions_last_activity ON sessions (last_activity);
+CREATE TABLE IF NOT EXISTS messages (
+    message_id TEXT PRIMARY KEY,
+    session_id TEXT NOT NULL,
+    user_id TEXT NOT NULL,
+    message TEXT NOT NULL,
+    response TEXT NOT NULL,
+    agent_used TEXT,
+    routing_reason TEXT,
+    timestamp REAL NOT NULL,
+    metadata TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS messages_session_timestamp ON messages (session_id, timestamp);
+"""
+
+_SESSION_COLUMNS = "session_id, user_id, created_at, last_activity, message_count, is_active, metadata"
+_MESSAGE_COLUMNS = ("message_id, user_id, session_id, message, response, agent_used, "
+                    "routing_reason, timestamp, metadata")
+
+def _row_to_session(row: Tuple) -> ChatSession:
+    return ChatSession(row[0], row[1], row[2], row[3], row[4], bool(row[5]), orjson.loads(row[6]))
+
+def _row_to_message(row: Tuple) -> ChatMessage:
+    return ChatMessage(*row[:8], orjson.loads(row[8]))
+
+class _SessionStore:
+    """Write-through SQLite (WAL) persistence for sessions and their messages."""
+    
+    def __init__(self, db_path: str):
+        # One connection shared by all threads; the lock serializes its use
+        self._conn = sqlite3.connect(db_path, check_same_thread=False, isolation_level=None)
+        self._lock = threading.Lock()
+        with self._lock:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.executescript(_SCHEMA)
+    
+    @contextmanager
+    def _transaction(self):
+        with self._lock:
+            self._conn.execute("BEGIN")
+            try:
+                yield self._conn
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+            self._conn.execute("COMMIT")
+    
+    def save_session(self, session: ChatSession) -> None:
+        with self._lock:
+            self._conn.execute(
+                f"INSERT OR REPLACE INTO sessions ({_SESSION_COLUMNS}) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (session.session_id, session.user_id, session.created_at, session.last_activity,
+                 session.message_count, session.is_active, orjson.dumps(session.metadata).decode()),
+            )
+    
+    def add_message(self, message: ChatMessage, session: ChatSession) -> None:
+        with self._transaction() as conn:
+            conn.execute(
+                f"INSERT INTO messages ({_MESSAGE_COLUMNS}) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (message.message_id, message.user_id, message.session_id, message.message,
+                 message.response, message.agent_used, message.routing_reason,
+                 message.timestamp, orjson.dumps(message.metadata).decode()),
+            )
+            conn.execute(
+                "UPDATE sessions SET last_activity = ?, message_count = ? WHERE session_id = ?",
+                (session.last_activity, session.message_count, session.session_id),
+            )
+    
+    def end_session(self, session_id: str) -> None:
+        with self._lock:
+            self._conn.execute("UPDATE sessions SET is_active = 0 WHERE session_id = ?", (session_id,))
+    
+    def load_session(self, session_id: str) -> Optional[ChatSession]:
+        with self._lock:
+            row = self._conn.execute(
+                f"SELECT {_SESSION_COLUMNS} FROM sessions WHERE session_id = ?", (session_id,)
+            ).fetchone()
+        return _row_to_session(row) if row else None
+    
+    def load_messages(self, session_id: str, limit: Optional[int] = None,
+                      before: Optional[str] = None) -> List[ChatMessage]:
+        """Return up to limit messages, oldest first, older than the before message."""
+        query = f"SELECT {_MESSAGE_COLUMNS} FROM messages WHERE session_id = ?"
+        params: List[Any] = [session_id]
+        if before is not None:
+            query += " AND timestamp < (SELECT timestamp FROM messages WHERE message_id = ?)"
+            params.append(before)
+        query += " ORDER BY timestamp DESC LIMIT ?"
+        params.append(limit or -1)
+        with self._lock:
+            rows = self._conn.execute(query, params).fetchall()
+        rows.reverse()
+        return [_row_to_message(row) for row in rows]
+    
+    def user_sessions(self, user_id: str) -> List[ChatSession]:
+        with self._lock:
+            rows = self._conn.execute(
+                f"SELECT {_SESSION_COLUMNS} FROM sessions WHERE user_id = ?", (user_id,)
+            ).fetchall()
+        return [_row_to_session(row) for row in rows]
+    
+    def delete_session(self, session_id: str) -> None:
+        with self._transaction() as conn:
+            conn.execute("DELETE FROM messages WHERE session_id = ?", (session_id,))
+            conn.execute("DELETE FROM sessions WHERE session_id = ?", (session_id,))
     
-    def __init__(self, session_timeout_hours: int = 24):
+    def delete_inactive_since(self, cutoff: float) -> int:
+        """Delete sessions with no activity since cutoff; returns how many were removed."""
+        with self._transaction() as conn:
+            conn.execute(
+                "DELETE FROM messages WHERE session_id IN "
+                "(SELECT session_id FROM sessions WHERE last_activity < ?)", (cutoff,)
+            )
+            return conn.execute("DELETE FROM sessions WHERE last_activity < ?", (cutoff,)).rowcount
+    
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            total, active, users = self._conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(is_active), 0), COUNT(DISTINCT user_id) FROM sessions"
+            ).fetchone()
+            messages = self._conn.execute("SELECT COUNT(*) FROM messages").fetchone()[0]
+        return {
+            "total_sessions": total,
+            "active_sessions": active,
+            "total_messages": messages,
+            "unique_users": users,
+        }
+
+class _Shard:
+    """A slice of the session and conversation maps guarded by its own lock."""
+    __slots__ = ("lock", "sessions", "conversations")
+    
+    def __init__(self):
+        # Re-entrant so add_message can validate the session under the same lock
+        self.lock = threading.RLock()
         self.sessions: Dict[str, ChatSession] = {}
-        self.conversations: Dict[str, List[ChatMessage]] = {}
+        self.conversations: Dict[str, Deque[ChatMessage]] = {}
+
+def _session_to_dict(session: ChatSession) -> Dict[str, Any]:
+    """Convert a session to a dict, exposing its epoch timestamps as datetimes.
+
+    Fields are copied shallowly (unlike dataclasses.asdict, which deep-copies
+    metadata); callers needing a deep copy should make one explicitly.
+    """
+    return {
+        'session_id': session.session_id,
+        'user_id': session.user_id,
+        'created_at': datetime.fromtimestamp(session.created_at),
+        'last_activity': datetime.fromtimestamp(session.last_activity),
+        'message_count': session.message_count,
+        'is_active': session.is_active,
+        'metadata': dict(session.metadata),
+    }
+
+def _message_to_dict(message: ChatMessage) -> Dict[str, Any]:
+    """Convert a message to a dict, exposing its epoch timestamp as a datetime.
+
+    Shallow copy, as for _session_to_dict.
+    """
+    return {
+        'message_id': message.message_id,
+        'user_id': message.user_id,
+        'session_id': message.session_id,
+        'message': message.message,
+        'response': message.response,
+        'agent_used': message.agent_used,
+        'routing_reason': message.routing_reason,
+        'timestamp': datetime.fromtimestamp(message.timestamp),
+        'metadata': dict(message.metadata),
+    }
+
+def _slice_conversation(conversation: Deque[ChatMessage], limit: Optional[int],
+                        before: Optional[str]) -> List[ChatMessage]:
+    """Return up to limit messages, oldest first, ending just before the cursor message."""
+    newest_first = reversed(conversation)
+    if before is not None:
+        for message in newest_first:
+            if message.message_id == before:
+                break
+        else:
+            return []
+    page = list(islice(newest_first, limit))
+    page.reverse()
+    return page
+
+class SessionManager:
+    """Manages chat sessions and conversation history.
+    
+    Sessions are spread over lock-striped shards by session id, so concurrent
+    requests on unrelated sessions never contend for the same lock.
+    
+    When db_path is given, sessions and messages are also written through to
+    SQLite. Memory then only holds recently used sessions; the rest are loaded
+    back on demand, including after a restart.
+    """
+    
+    def __init__(self, session_timeout_hours: int = 24, db_path: Optional[str] = None):
+        self._shards = [_Shard() for _ in range(_SHARD_COUNT)]
         self.session_timeout_hours = session_timeout_hours
-        self._cleanup_interval = 3600  # Clean up every hour
-        self._last_cleanup = time.time()
+        self._timeout_seconds = session_timeout_hours * 3600
+        self._store = _SessionStore(db_path) if db_path else None
+        # How long an idle session stays in memory; only less than the
+        # timeout when the store can bring it back
+        self._memory_ttl_seconds = (
+            min(self._timeout_seconds, _HOT_SESSION_IDLE_SECONDS) if self._store else self._timeout_seconds
+        )
+        # (earliest possible expiry, session_id), one entry per live session;
+        # entries whose session saw activity since are re-queued when popped
+        self._expiry_heap: List[Tuple[float, str]] = []
+        self._expiry_lock = threading.Lock()
+        self._sweeper: Optional[threading.Thread] = None
+        # user_id -> ids of that user's sessions, so lookups skip a full scan
+        self._user_sessions: Dict[str, set] = {}
+        self._user_index_lock = threading.Lock()
+    
+    def _shard_for(self, session_id: str) -> _Shard:
+        """Return the shard that owns a session id."""
+        return self._shards[hash(session_id) & (_SHARD_COUNT - 1)]
     
     def generate_session_id(self) -> str:
         """Generate a unique session ID."""
-        return f"session_{uuid.uuid4().hex[:16]}"
+        return f"session_{token_hex(8)}"
     
     def generate_user_id(self) -> str:
         """Generate a unique user ID for anonymous users."""
-        return f"user_{uuid.uuid4().hex[:12]}"
+        return f"user_{token_hex(6)}"
     
     def create_session(self, user_id: Optional[str] = None, metadata: Optional[Dict[str, Any]] = None) -> str:
         """
@@ -69,26 +314,53 @@ class SessionManager:
         session_id = self.generate_session_id()
         
         # Create session
+        now = time.time()
         session = ChatSession(
             session_id=session_id,
             user_id=user_id,
-            created_at=datetime.now(),
-            last_activity=datetime.now(),
+            created_at=now,
+            last_activity=now,
             message_count=0,
             is_active=True,
             metadata=metadata or {}
         )
         
         # Store session and initialize conversation
-        self.sessions[session_id] = session
-        self.conversations[session_id] = []
+        shard = self._shard_for(session_id)
+        with shard.lock:
+            shard.sessions[session_id] = session
+            shard.conversations[session_id] = deque(maxlen=_MAX_MESSAGES_PER_SESSION)
+        with self._user_index_lock:
+            self._user_sessions.setdefault(user_id, set()).add(session_id)
+        if self._store:
+            self._store.save_session(session)
+        self._schedule_expiry(session_id, now + self._memory_ttl_seconds)
         
-        logger.info(f"Created new session {session_id} for user {user_id}")
+        logger.debug("Created new session %s for user %s", session_id, user_id)
         return session_id
     
     def get_session(self, session_id: str) -> Optional[ChatSession]:
         """Get a session by ID."""
-        return self.sessions.get(session_id)
+        shard = self._shard_for(session_id)
+        with shard.lock:
+            session = shard.sessions.get(session_id)
+            if session is None and self._store:
+                session = self._load_session(shard, session_id)
+            return session
+    
+    def _load_session(self, shard: _Shard, session_id: str) -> Optional[ChatSession]:
+        """Bring a stored session and its conversation back into memory (shard lock held)."""
+        session = self._store.load_session(session_id)
+        if session is None or time.time() - session.last_activity > self._timeout_seconds:
+            return None
+        shard.sessions[session_id] = session
+        shard.conversations[session_id] = deque(
+            self._store.load_messages(session_id, _MAX_MESSAGES_PER_SESSION), maxlen=_MAX_MESSAGES_PER_SESSION
+        )
+        with self._user_index_lock:
+            self._user_sessions.setdefault(session.user_id, set()).add(session_id)
+        self._schedule_expiry(session_id, session.last_activity + self._memory_ttl_seconds)
+        return session
     
     def is_session_valid(self, session_id: str) -> bool:
         """Check if a session is valid and not expired."""
@@ -101,8 +373,7 @@ class SessionManager:
             return False
         
         # Check if session has expired
-        timeout_threshold = datetime.now() - timedelta(hours=self.session_timeout_hours)
-        if session.last_activity < timeout_threshold:
+        if time.time() - session.last_activity > self._timeout_seconds:
             session.is_active = False
             return False
         
@@ -126,12 +397,8 @@ class SessionManager:
         Returns:
             Message ID
         """
-        # Validate session
-        if not self.is_session_valid(session_id):
-            raise ValueError(f"Invalid or expired session: {session_id}")
-        
         # Generate message ID
-        message_id = f"msg_{uuid.uuid4().hex[:12]}"
+        message_id = f"msg_{token_hex(6)}"
         
         # Create chat message
         chat_message = ChatMessage(
@@ -142,99 +409,223 @@ class SessionManager:
             response=response,
             agent_used=agent_used,
             routing_reason=routing_reason,
-            timestamp=datetime.now(),
+            timestamp=time.time(),
             metadata=metadata or {}
         )
         
-        # Add to conversation history
-        if session_id not in self.conversations:
-            self.conversations[session_id] = []
-        
-        self.conversations[session_id].append(chat_message)
-        
-        # Update session
-        session = self.sessions[session_id]
-        session.last_activity = datetime.now()
-        session.message_count += 1
+        shard = self._shard_for(session_id)
+        with shard.lock:
+            # Validate session
+            if not self.is_session_valid(session_id):
+                raise ValueError(f"Invalid or expired session: {session_id}")
+            
+            # Add to conversation history
+            shard.conversations.setdefault(session_id, deque(maxlen=_MAX_MESSAGES_PER_SESSION)).append(chat_message)
+            
+            # Update session
+            session = shard.sessions[session_id]
+            session.last_activity = chat_message.timestamp
+            session.message_count += 1
+            if self._store:
+                self._store.add_message(chat_message, session)
         
-        logger.info(f"Added message {message_id} to session {session_id}")
+        logger.debug("Added message %s to session %s", message_id, session_id)
         return message_id
     
-    def get_conversation_history(self, session_id: str, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+    def get_conversation_history(self, session_id: str, limit: Optional[int] = None,
+                                 before: Optional[str] = None) -> List[Dict[str, Any]]:
         """
         Get conversation history for a session.
         
         Args:
             session_id: Session ID
             limit: Maximum number of messages to return (None for all)
+            before: Optional message ID; only messages older than it are returned
             
         Returns:
-            List of message dictionaries
+            List of message dictionaries, oldest first
         """
-        if session_id not in self.conversations:
-            return []
-        
-        messages = self.conversations[session_id]
-        
+        # Slice under the lock; only the returned messages are converted, without it
+        shard = self._shard_for(session_id)
+        with shard.lock:
+            conversation = shard.conversations.get(session_id)
+            if conversation is None and self._store:
+                # Not hot; page straight from the messages index instead of loading it all
+                messages = self._store.load_messages(session_id, limit or None, before)
+            elif not conversation:
+                return []
+            else:
+                messages = _slice_conversation(conversation, limit or None, before)
+                # A full buffer may have dropped older messages the store still has
+                if (self._store and len(conversation) == conversation.maxlen
+                        and (not limit or len(messages) < limit)):
+                    messages = self._store.load_messages(session_id, limit or None, before)
+
         # Convert to dictionaries
-        message_dicts = [asdict(msg) for msg in messages]
-        
-        # Apply limit if specified
-        if limit:
-            message_dicts = message_dicts[-limit:]
+        return [_message_to_dict(msg) for msg in messages]
+    
+    def get_conversation_page(self, session_id: str, limit: int = 20,
+                              before: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Get one page of conversation history, walking backwards from the newest message.
         
-        return message_dicts
+        Args:
+            session_id: Session ID
+            limit: Page size
+            before: Cursor from the previous page (None for the newest page)
+            
+        Returns:
+            {"messages": [...], "next_cursor": message ID to pass as before, or None}
+        """
+        messages = self.get_conversation_history(session_id, limit, before)
+        next_cursor = messages[0]["message_id"] if limit and len(messages) == limit else None
+        return {"messages": messages, "next_cursor": next_cursor}
     
     def get_user_sessions(self, user_id: str) -> List[Dict[str, Any]]:
         """Get all sessions for a user."""
+        if self._store:
+            # Written through on every change, so the store has every session
+            user_sessions = []
+            for session in self._store.user_sessions(user_id):
+                session_dict = _session_to_dict(session)
+                session_dict['conversation_count'] = session.message_count
+                user_sessions.append(session_dict)
+            return user_sessions
+        
         user_sessions = []
         
-        for session in self.sessions.values():
-            if session.user_id == user_id:
-                session_dict = asdict(session)
-                session_dict['conversation_count'] = len(self.conversations.get(session.session_id, []))
-                user_sessions.append(session_dict)
+        with self._user_index_lock:
+            session_ids = list(self._user_sessions.get(user_id, ()))
+        
+        for session_id in session_ids:
+            shard = self._shard_for(session_id)
+            with shard.lock:
+                session = shard.sessions.get(session_id)
+                if session is None:
+                    continue
+                session_dict = _session_to_dict(session)
+                session_dict['conversation_count'] = session.message_count
+            user_sessions.append(session_dict)
         
         return user_sessions
     
     def end_session(self, session_id: str) -> bool:
         """End a session (mark as inactive)."""
-        if session_id in self.sessions:
-            self.sessions[session_id].is_active = False
-            logger.info(f"Ended session {session_id}")
-            return True
-        return False
+        shard = self._shard_for(session_id)
+        with shard.lock:
+            session = shard.sessions.get(session_id)
+            if session is None and self._store:
+                session = self._load_session(shard, session_id)
+            if session is None:
+                return False
+            session.is_active = False
+            if self._store:
+                self._store.end_session(session_id)
+        logger.debug("Ended session %s", session_id)
+        return True
     
     def cleanup_expired_sessions(self) -> int:
         """Clean up expired sessions and return count of cleaned sessions."""
-        current_time = datetime.now()
-        timeout_threshold = current_time - timedelta(hours=self.session_timeout_hours)
+        cleaned = 0
+        while True:
+            examined, removed = self._sweep_expired(_SWEEP_CHUNK_SIZE)
+            cleaned += removed
+            if examined < _SWEEP_CHUNK_SIZE:
+                break
         
-        expired_sessions = []
+        if self._store:
+            # Sessions already dropped from memory are only on disk
+            cleaned += self._store.delete_inactive_since(time.time() - self._timeout_seconds)
         
-        for session_id, session in self.sessions.items():
-            if session.last_activity < timeout_threshold:
-                expired_sessions.append(session_id)
+        if cleaned:
+            logger.info("Cleaned up %d expired sessions", cleaned)
         
-        # Remove expired sessions
-        for session_id in expired_sessions:
-            del self.sessions[session_id]
-            if session_id in self.conversations:
-                del self.conversations[session_id]
+        return cleaned
+    
+    def _schedule_expiry(self, session_id: str, expires_at: float) -> None:
+        """Queue a session for the expiry sweep, starting the sweeper on first use."""
+        with self._expiry_lock:
+            heapq.heappush(self._expiry_heap, (expires_at, session_id))
+            if self._sweeper is None:
+                self._sweeper = threading.Thread(
+                    target=self._sweep_forever, name="session-expiry-sweeper", daemon=True
+                )
+                self._sweeper.start()
+    
+    def _sweep_forever(self) -> None:
+        """Background loop: remove expired sessions one bounded chunk at a time."""
+        while True:
+            time.sleep(_SWEEP_INTERVAL_SECONDS)
+            try:
+                self.cleanup_expired_sessions()
+            except Exception:
+                logger.exception("Session expiry sweep failed")
+    
+    def _unindex_user_session(self, user_id: str, session_id: str) -> None:
+        """Drop a removed session from the user index."""
+        with self._user_index_lock:
+            session_ids = self._user_sessions.get(user_id)
+            if session_ids is not None:
+                session_ids.discard(session_id)
+                if not session_ids:
+                    del self._user_sessions[user_id]
+    
+    def _sweep_expired(self, limit: int) -> Tuple[int, int]:
+        """
+        Pop up to limit due entries off the expiry heap.
         
-        if expired_sessions:
-            logger.info(f"Cleaned up {len(expired_sessions)} expired sessions")
+        Returns:
+            (entries examined, sessions removed)
+        """
+        now = time.time()
+        examined = removed = 0
+        while examined < limit:
+            with self._expiry_lock:
+                if not self._expiry_heap or self._expiry_heap[0][0] > now:
+                    break
+                _, session_id = heapq.heappop(self._expiry_heap)
+            examined += 1
+            
+            shard = self._shard_for(session_id)
+            with shard.lock:
+                session = shard.sessions.get(session_id)
+                if session is None:
+                    continue
+                evict_at = session.last_activity + self._memory_ttl_seconds
+                if evict_at <= now:
+                    del shard.sessions[session_id]
+                    shard.conversations.pop(session_id, None)
+                    self._unindex_user_session(session.user_id, session_id)
+                    if session.last_activity + self._timeout_seconds <= now:
+                        if self._store:
+                            self._store.delete_session(session_id)
+                        removed += 1
+                    continue
+            
+            # Active since it was queued; check again at its new expiry
+            with self._expiry_lock:
+                heapq.heappush(self._expiry_heap, (evict_at, session_id))
         
-        return len(expired_sessions)
+        return examined, removed
     
     def get_session_stats(self) -> Dict[str, Any]:
         """Get statistics about all sessions."""
-        total_sessions = len(self.sessions)
-        active_sessions = sum(1 for s in self.sessions.values() if s.is_active)
-        total_messages = sum(len(conv) for conv in self.conversations.values())
+        if self._store:
+            stats = self._store.stats()
+            stats["session_timeout_hours"] = self.session_timeout_hours
+            return stats
+        
+        total_sessions = 0
+        active_sessions = 0
+        total_messages = 0
+        unique_users = set()
         
-        # Get unique users
-        unique_users = set(session.user_id for session in self.sessions.values())
+        for shard in self._shards:
+            with shard.lock:
+                total_sessions += len(shard.sessions)
+                active_sessions += sum(1 for s in shard.sessions.values() if s.is_active)
+                total_messages += sum(s.message_count for s in shard.sessions.values())
+                unique_users.update(session.user_id for session in shard.sessions.values())
         
         return {
             "total_sessions": total_sessions,
@@ -251,9 +642,9 @@ class SessionManager:
             return {}
         
         return {
-            "session": asdict(session),
+            "session": _session_to_dict(session),
             "conversation": self.get_conversation_history(session_id)
         }
 
 # Global session manager instance
-session_manager = SessionManager() 
\ No newline at end of file
+session_manager = SessionManager(db_path=os.getenv("SESSION_DB_PATH")) 
\ No newline at end of file
@@ -1,8 +1,10 @@
+import asyncio
 import os
-import time
+from types import MappingProxyType
 from typing import Optional
 import uuid
-import requests
+import aiohttp
+import orjson
 from dotenv import load_dotenv
 from google import genai
 from google.genai import types
@@ -19,7 +21,42 @@ text_config = types.GenerateContentConfig(
     response_mime_type="text/plain",
 )
 
-import json
+_CAPTIONS_API_URL = "https://api.captions.ai/api/ads"
+
+CAPTIONS_API_KEY = os.getenv("CAPTIONS_API_KEY")
+if not CAPTIONS_API_KEY:
+    print("Warning: CAPTIONS_API_KEY is not set; video generation requests will be rejected")
+
+_CAPTIONS_HEADERS = MappingProxyType({
+    "x-api-key": CAPTIONS_API_KEY or "",
+    "Content-Type": "application/json",
+})
+
+# Background footage passed to every Captions ad generation
+_MEDIA_URLS = (
+    "https://gw42iab886.ufs.sh/f/ixsAdYLYnHROih5p2yLYnHROVl5XJ2suCxDjKBP0c4W7TaMN",
+    "https://gw42iab886.ufs.sh/f/ixsAdYLYnHROy3wMC5bX40QiFdVDRrqTNOIUtfx83ApJgcZ5",
+    "https://gw42iab886.ufs.sh/f/ixsAdYLYnHROw42Mxc7Pk0vj8WqyAMb2R5hYc3us7H69zdeS",
+    "https://gw42iab886.ufs.sh/f/ixsAdYLYnHROTHLMkODSLz5DayZfGBPqY8CUJgW0EvhHe97b",
+    "https://gw42iab886.ufs.sh/f/ixsAdYLYnHRO2DjsqfT5JyvCIUBlOEhNQMVrdfewzDmxYLTc",
+    "https://gw42iab886.ufs.sh/f/ixsAdYLYnHRO8mJk9pWhJzsZU5XQi7kwILNWu1OAhBd4qnPt",
+    "https://gw42iab886.ufs.sh/f/ixsAdYLYnHROLQt86mYxDnq6Qr3cFHUAG9pJuCXfPokadtZw",
+    "https://gw42iab886.ufs.sh/f/ixsAdYLYnHRODz4sApPUgZsPrI9xfW7mFXNeL1aBiz6GuopC",
+)
+
+# Shared HTTP session for the Captions API, created on first use inside the
+# running event loop and closed from the app lifespan
+_http_session: Optional[aiohttp.ClientSession] = None
+
+def _get_http_session() -> aiohttp.ClientSession:
+    global _http_session
+    if _http_session is None or _http_session.closed:
+        _http_session = aiohttp.ClientSession()
+    return _http_session
+
+async def close_http_session() -> None:
+    if _http_session is not None and not _http_session.closed:
+        await _http_session.close()
 
 async def give_captions_and_tags(context: str):
     model = "gemini-2.0-flash"
@@ -44,8 +81,9 @@ Fill in the following fields and return ONLY valid JSON (no extra text):
         ],
     )
 
+    # Async client so the stream yields to the event loop between chunks
     response = ""
-    for chunk in client.models.generate_content_stream(
+    async for chunk in await client.aio.models.generate_content_stream(
         model=model,
         contents=contents,
         config=text_config,
@@ -56,13 +94,18 @@ Fill in the following fields and return ONLY valid JSON (no extra text):
     try:
         start = response.find("{")
         end = response.rfind("}") + 1    
-        return json.loads(response[start:end])
+        return orjson.loads(response[start:end])
     except Exception as e:
         print("Failed to parse AI response as JSON:", e)
         result = None
 
     return result
 
+# Captions API job polling: start fast, back off to once a minute, give up after 30 minutes
+_POLL_INITIAL_DELAY_SECONDS = 2
+_POLL_MAX_DELAY_SECONDS = 60
+_POLL_TIMEOUT_SECONDS = 30 * 60
+
 async def generate(prompt: str, user_id: str, insta_acc_id: str) -> Optional[Video]:
     # Fetch the actual documents to create proper Link objects
     user = await User.get(user_id)
@@ -73,31 +116,15 @@ async def generate(prompt: str, user_id: str, insta_acc_id: str) -> Optional[Vid
         print("Failed to generate captions, tags, and scenes")
         return
 
-    url = "https://api.captions.ai/api/ads"
-
-    headers = {
-        "x-api-key": os.getenv("CAPTIONS_API_KEY"),
-        "Content-Type": "application/json"
-    }
-
     payload = {
         "script": captions_tags["prompt"],
         "creatorName": "Kate",
-        "mediaUrls": [
-            "https://gw42iab886.ufs.sh/f/ixsAdYLYnHROih5p2yLYnHROVl5XJ2suCxDjKBP0c4W7TaMN",
-            "https://gw42iab886.ufs.sh/f/ixsAdYLYnHROy3wMC5bX40QiFdVDRrqTNOIUtfx83ApJgcZ5", 
-            "https://gw42iab886.ufs.sh/f/ixsAdYLYnHROw42Mxc7Pk0vj8WqyAMb2R5hYc3us7H69zdeS",
-            "https://gw42iab886.ufs.sh/f/ixsAdYLYnHROTHLMkODSLz5DayZfGBPqY8CUJgW0EvhHe97b",
-            "https://gw42iab886.ufs.sh/f/ixsAdYLYnHRO2DjsqfT5JyvCIUBlOEhNQMVrdfewzDmxYLTc",
-            "https://gw42iab886.ufs.sh/f/ixsAdYLYnHRO8mJk9pWhJzsZU5XQi7kwILNWu1OAhBd4qnPt",
-            "https://gw42iab886.ufs.sh/f/ixsAdYLYnHROLQt86mYxDnq6Qr3cFHUAG9pJuCXfPokadtZw",
-            "https://gw42iab886.ufs.sh/f/ixsAdYLYnHRODz4sApPUgZsPrI9xfW7mFXNeL1aBiz6GuopC"
-        ]
+        "mediaUrls": list(_MEDIA_URLS),
     }
 
-    response = requests.request("POST", f"{url}/submit", json=payload, headers=headers)
-    
-    operationId = response.json().get("operationId")
+    session = _get_http_session()
+    async with session.post(f"{_CAPTIONS_API_URL}/submit", json=payload, headers=_CAPTIONS_HEADERS) as response:
+        operationId = (await response.json(content_type=None)).get("operationId")
 
     payload = {
         "operationId": operationId,
@@ -106,26 +133,29 @@ async def generate(prompt: str, user_id: str, insta_acc_id: str) -> Optional[Vid
     json_response = None
 
     try:
+        # Poll with exponential backoff; the job is finished once the response
+        # stops reporting progress (it then carries the video url instead)
+        delay = _POLL_INITIAL_DELAY_SECONDS
+        deadline = asyncio.get_running_loop().time() + _POLL_TIMEOUT_SECONDS
         while True:
-            response = requests.request("POST", f"{url}/poll", json=payload, headers=headers)
-            json_response = response.json()
-            if "progress" not in json_response:
-                raise Exception("Invalid response format, 'state' key not found")
-            time.sleep(60)
-    except Exception as e:
-        try:
-            # Check if json_response is valid and contains the "url" key
-            if json_response and "url" in json_response:
-                # Send a GET request to the URL
-                response = requests.get(json_response["url"], stream=True)
+            async with session.post(f"{_CAPTIONS_API_URL}/poll", json=payload, headers=_CAPTIONS_HEADERS) as response:
+                json_response = await response.json(content_type=None)
+            if "progress" not in json_response or asyncio.get_running_loop().time() >= deadline:
+                break
+            await asyncio.sleep(delay)
+            delay = min(delay * 1.5, _POLL_MAX_DELAY_SECONDS)
+
+        # Check if json_response is valid and contains the "url" key
+        if json_response and "url" in json_response:
+            # Send a GET request to the URL
+            async with session.get(json_response["url"]) as response:
                 uuid_str = str(uuid.uuid4())  # Generate a unique identifier for the video file
                 # Check if the request was successful
-                if response.status_code == 200 and insta_acc and user:
-                    # Open a file in binary write mode and save the video
+                if response.status == 200 and insta_acc and user:
+                    # Open a file in binary write mode and save the video as it streams in
                     with open(f"storage/video_{uuid_str}.mp4", "wb") as f:
-                        for chunk in response.iter_content(chunk_size=8192):
-                            if chunk:
-                                f.write(chunk)
+                        async for chunk in response.content.iter_chunked(8192):
+                            f.write(chunk)
                     video = Video(
                         generation_prompt=prompt,
                         scheduled_time=None,  # Set to None for now, can be updated later
@@ -141,8 +171,8 @@ async def generate(prompt: str, user_id: str, insta_acc_id: str) -> Optional[Vid
                     print(f"Video downloaded successfully as video.mp4")
                     return video
                 else:
-                    print(f"Failed to download video. Status code: {response.status_code}")
-            else:
-                print("No valid URL found in json_response to download the video.")
-        except Exception as e:
-            print(f"An error occurred: {str(e)}")
\ No newline at end of file
+                    print(f"Failed to download video. Status code: {response.status}")
+        else:
+            print("No valid URL found in json_response to download the video.")
+    except Exception as e:
+        print(f"An error occurred: {str(e)}")
\ No newline at end of file
@@ -7,10 +7,16 @@ This version doesn't require MongoDB or external dependencies.
 import uvicorn
 from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse, Response
 from pydantic import BaseModel, Field
-from typing import Optional, Dict, Any
-from datetime import datetime
+from typing import Annotated, Optional, Dict, Any, List, Mapping, Tuple
+import functools
+import importlib.util
 import logging
+import orjson
+import re
+import time
+from types import MappingProxyType
 
 # Set up logging
 logging.basicConfig(level=logging.INFO)
@@ -22,74 +28,105 @@ class ChatRequest(BaseModel):
     user_id: Optional[str] = Field(None, description="Optional user ID for session tracking")
     session_id: Optional[str] = Field(None, description="Optional session ID for conversation continuity")
 
+class ChatBatchRequest(BaseModel):
+    messages: List[Annotated[str, Field(min_length=1, max_length=2000)]] = Field(..., min_length=1, max_length=1000, description="Messages to route")
+
 class ChatResponse(BaseModel):
     success: bool
     message: str
     response: str = Field(..., description="AI agent's response")
     agent_used: Optional[str] = Field(None, description="Which specialized agent was used")
     routing_reason: Optional[str] = Field(None, description="Why this agent was chosen")
-    timestamp: datetime = Field(default_factory=datetime.now)
+    timestamp: float = Field(default_factory=time.time, description="Epoch seconds when the response was built")
 
 # Create FastAPI instance
 app = FastAPI(
     title="Videmy Study Chat API (Simple)",
     description="Simplified API for testing chat functionality",
-    version="1.0.0"
+    version="1.0.0",
+    default_response_class=ORJSONResponse,
 )
 
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["*"],
-    allow_credentials=True,
-    allow_methods=["GET", "POST", "PUT", "DELETE", "OPTIONS"],
+    # Same frontends as the main app; these servers set no cookies, so no credentials
+    allow_origins=[
+        "http://localhost:8080",
+        "http://localhost:4173",
+        "https://getreals.club",
+        "https://getrealsclub.vercel.app",
+    ],
+    allow_credentials=False,
+    allow_methods=["GET", "POST"],
     allow_headers=["*"],
 )
 
+# All routing keywords in one pattern, compiled once; the named group of a
+# match is its category. Anchoring at word starts keeps plurals like
+# "markets" matching while "fed" no longer fires in "confederate".
+_ROUTING_RE = re.compile(
+    r"\b(?:(?P<academic>research|paper|academic|study|literature|citation)"
+    r"|(?P<fomc>fed|fomc|federal reserve|interest rates|monetary policy|financial|market)"
+    r"|(?P<political>political|news|government|election|policy|current events))"
+)
+
+# Demos and test loops repeat the same prompts, so classifications are memoized
+@functools.lru_cache(maxsize=4096)
+def _match_category(message_lower: str) -> Optional[str]:
+    """Classify a lowercased message in one scan, honouring academic > fomc > political."""
+    found = set()
+    for match in _ROUTING_RE.finditer(message_lower):
+        if match.lastgroup == "academic":
+            return "academic"
+        found.add(match.lastgroup)
+    if "fomc" in found:
+        return "fomc"
+    return "political" if found else None
+
+# Canned routing replies, built once and frozen; process_chat_message hands
+# out the shared instance and callers only read from it.
+_SIMULATED_RESPONSES = {
+    "academic": MappingProxyType({
+        "success": True,
+        "message": "Message processed successfully",
+        "response": "I'll route this to our Academic Research Agent. This agent specializes in analyzing research papers, finding related literature, and providing research direction suggestions.",
+        "agent_used": "academic_coordinator",
+        "routing_reason": "Academic research keywords detected"
+    }),
+    "fomc": MappingProxyType({
+        "success": True,
+        "message": "Message processed successfully",
+        "response": "I'll route this to our FOMC Research Agent. This agent specializes in analyzing Federal Reserve meetings, financial market implications, and economic policy analysis.",
+        "agent_used": "fomc_research_agent",
+        "routing_reason": "Financial/FOMC keywords detected"
+    }),
+    "political": MappingProxyType({
+        "success": True,
+        "message": "Message processed successfully",
+        "response": "I'll route this to our Political News Agent. This agent specializes in gathering and analyzing political news from multiple sources with bias detection.",
+        "agent_used": "political_news_coordinator",
+        "routing_reason": "Political news keywords detected"
+    }),
+}
+
+_DEFAULT_RESPONSE = MappingProxyType({
+    "success": True,
+    "message": "Message processed successfully",
+    "response": "I can help you with academic research, financial analysis, or political news. Please ask me about any of these topics, and I'll route your query to the appropriate specialized agent.",
+    "agent_used": "routing_agent",
+    "routing_reason": "General inquiry - providing guidance"
+})
+
 class SimpleChatManager:
     """Simple chat manager for testing without external dependencies."""
     
-    def __init__(self):
-        self.available_agents = ["academic_coordinator", "fomc_research_agent", "political_news_coordinator"]
+    # Never mutated, so shared by every instance and handed out as-is
+    AVAILABLE_AGENTS: Tuple[str, ...] = ("academic_coordinator", "fomc_research_agent", "political_news_coordinator")
     
-    async def process_chat_message(self, message: str, user_id: Optional[str] = None, session_id: Optional[str] = None) -> Dict[str, Any]:
+    async def process_chat_message(self, message: str, user_id: Optional[str] = None, session_id: Optional[str] = None) -> Mapping[str, Any]:
         """Process a chat message and simulate routing."""
         try:
-            message_lower = message.lower()
-            
-            # Simple keyword-based routing simulation
-            if any(keyword in message_lower for keyword in ["research", "paper", "academic", "study", "literature", "citation"]):
-                return {
-                    "success": True,
-                    "message": "Message processed successfully",
-                    "response": "I'll route this to our Academic Research Agent. This agent specializes in analyzing research papers, finding related literature, and providing research direction suggestions.",
-                    "agent_used": "academic_coordinator",
-                    "routing_reason": "Academic research keywords detected"
-                }
-            elif any(keyword in message_lower for keyword in ["fed", "fomc", "federal reserve", "interest rates", "monetary policy", "financial", "market"]):
-                return {
-                    "success": True,
-                    "message": "Message processed successfully",
-                    "response": "I'll route this to our FOMC Research Agent. This agent specializes in analyzing Federal Reserve meetings, financial market implications, and economic policy analysis.",
-                    "agent_used": "fomc_research_agent",
-                    "routing_reason": "Financial/FOMC keywords detected"
-                }
-            elif any(keyword in message_lower for keyword in ["political", "news", "government", "election", "policy", "current events"]):
-                return {
-                    "success": True,
-                    "message": "Message processed successfully",
-                    "response": "I'll route this to our Political News Agent. This agent specializes in gathering and analyzing political news from multiple sources with bias detection.",
-                    "agent_used": "political_news_coordinator",
-                    "routing_reason": "Political news keywords detected"
-                }
-            else:
-                return {
-                    "success": True,
-                    "message": "Message processed successfully",
-                    "response": "I can help you with academic research, financial analysis, or political news. Please ask me about any of these topics, and I'll route your query to the appropriate specialized agent.",
-                    "agent_used": "routing_agent",
-                    "routing_reason": "General inquiry - providing guidance"
-                }
-                
+            return _SIMULATED_RESPONSES.get(_match_category(message.strip().lower()), _DEFAULT_RESPONSE)
         except Exception as e:
             logger.error(f"Error processing chat message: {e}")
             return {
@@ -100,9 +137,17 @@ class SimpleChatManager:
                 "routing_reason": "Error occurred"
             }
     
-    def get_available_agents(self) -> list:
+    def classify_batch(self, messages: List[str]) -> List[Tuple[str, str]]:
+        """Route many messages in one call, returning (agent_used, routing_reason) for each."""
+        routes = []
+        for message in messages:
+            result = _SIMULATED_RESPONSES.get(_match_category(message.strip().lower()), _DEFAULT_RESPONSE)
+            routes.append((result["agent_used"], result["routing_reason"]))
+        return routes
+    
+    def get_available_agents(self) -> tuple:
         """Get list of available specialized agents."""
-        return self.available_agents.copy()
+        return self.AVAILABLE_AGENTS
     
     def is_available(self) -> bool:
         """Check if the chat service is available."""
@@ -128,17 +173,44 @@ async def chat_with_agents(request: ChatRequest):
             session_id=request.session_id
         )
         
-        return ChatResponse(
+        # The fields come from our own canned replies, so skip re-validating them
+        return ChatResponse.model_construct(
             success=result["success"],
             message=result["message"],
             response=result["response"],
             agent_used=result["agent_used"],
-            routing_reason=result["routing_reason"]
+            routing_reason=result["routing_reason"],
+            timestamp=time.time()
         )
         
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Chat processing failed: {str(e)}")
 
+@app.post("/chat/batch")
+async def chat_batch(request: ChatBatchRequest):
+    """
+    Classify a batch of messages in one request.
+    
+    Returns the agent each message would be routed to, in request order,
+    without building a full chat response per message.
+    """
+    routes = chat_manager.classify_batch(request.messages)
+    return {
+        "success": True,
+        "routes": [
+            {"agent_used": agent_used, "routing_reason": routing_reason}
+            for agent_used, routing_reason in routes
+        ],
+    }
+
+# Static for the life of the process, so encoded once
+_AGENTS_BODY = orjson.dumps({
+    "success": True,
+    "available_agents": chat_manager.get_available_agents(),
+    "total_agents": len(chat_manager.get_available_agents()),
+    "service_status": "available" if chat_manager.is_available() else "unavailable"
+})
+
 @app.get("/chat/agents")
 async def get_available_agents():
     """
@@ -147,16 +219,7 @@ async def get_available_agents():
     Returns information about which AI agents are currently available
     for routing user queries.
     """
-    try:
-        agents = chat_manager.get_available_agents()
-        return {
-            "success": True,
-            "available_agents": agents,
-            "total_agents": len(agents),
-            "service_status": "available" if chat_manager.is_available() else "unavailable"
-        }
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Failed to get agent information: {str(e)}")
+    return Response(content=_AGENTS_BODY, media_type="application/json")
 
 @app.get("/chat/health")
 async def chat_health_check():
@@ -180,19 +243,21 @@ async def chat_health_check():
             "status": "unhealthy"
         }
 
+_ROOT_BODY = orjson.dumps({
+    "message": "Videmy Study Chat API (Simple Version)",
+    "version": "1.0.0",
+    "endpoints": {
+        "chat": "/chat",
+        "agents": "/chat/agents", 
+        "health": "/chat/health",
+        "docs": "/docs"
+    }
+})
+
 @app.get("/")
 async def root():
     """Root endpoint with API information."""
-    return {
-        "message": "Videmy Study Chat API (Simple Version)",
-        "version": "1.0.0",
-        "endpoints": {
-            "chat": "/chat",
-            "agents": "/chat/agents", 
-            "health": "/chat/health",
-            "docs": "/docs"
-        }
-    }
+    return Response(content=_ROOT_BODY, media_type="application/json")
 
 if __name__ == "__main__":
     print("🚀 Starting Videmy Study Simple Chat Server...")
@@ -206,5 +271,7 @@ if __name__ == "__main__":
         host="0.0.0.0",
         port=8000,
         reload=True,
+        loop="uvloop" if importlib.util.find_spec("uvloop") else "asyncio",  # no uvloop on Windows
+        http="httptools",
         log_level="info"
     ) 
\ No newline at end of file
@@ -4,6 +4,7 @@ Startup script for the Videmy Study API server.
 Optimized for Render deployment.
 """
 
+import importlib.util
 import uvicorn
 import os
 from dotenv import load_dotenv
@@ -11,6 +12,10 @@ from dotenv import load_dotenv
 # Load environment variables
 load_dotenv()
 
+def _loop_implementation() -> str:
+    """Use uvloop where it is installed (it does not support Windows)."""
+    return "uvloop" if importlib.util.find_spec("uvloop") else "asyncio"
+
 if __name__ == "__main__":
     # Get configuration from environment variables or use defaults
     host = os.getenv("HOST", "0.0.0.0")
@@ -24,11 +29,18 @@ if __name__ == "__main__":
     print(f"🌍 Environment: {os.getenv('ENVIRONMENT', 'development')}")
     print("=" * 50)
     
+    # Several workers only make sense without reload; chat sessions and the
+    # scheduler live in process memory, so scaling out is opt-in
+    workers = 1 if reload else int(os.getenv("WEB_CONCURRENCY", "1"))
+    
     # Start the server
     uvicorn.run(
         "app:app",
         host=host,
         port=port,
         reload=reload,
+        workers=workers,
+        loop=_loop_implementation(),
+        http="httptools",
         log_level="info"
     ) 
\ No newline at end of file
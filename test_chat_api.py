@@ -4,141 +4,136 @@ Test script for the Videmy Study Chat API endpoints.
 """
 
 import asyncio
-import aiohttp
-import json
+import httpx
+import orjson
 import pytest
+import pytest_asyncio
 from typing import Dict, Any
 
+try:
+    import uvloop  # not available on Windows
+except ImportError:
+    uvloop = None
+
 # API base URL (adjust as needed)
 BASE_URL = "http://localhost:8000"
+CHAT_URL = f"{BASE_URL}/chat"
+AGENTS_URL = f"{BASE_URL}/chat/agents"
+HEALTH_URL = f"{BASE_URL}/chat/health"
+
+# Request fields shared by every standalone /chat call
+_CHAT_PAYLOAD_TEMPLATE = {"session_id": "test_session"}
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+def _make_client() -> httpx.AsyncClient:
+    """One pooled client; against a TLS deployment HTTP/2 multiplexes every request over one connection."""
+    return httpx.AsyncClient(
+        http2=True,
+        limits=httpx.Limits(max_connections=64, max_keepalive_connections=32),
+        timeout=30.0,
+    )
 
-@pytest.fixture
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
 async def session():
-    """Create an aiohttp session for testing."""
-    async with aiohttp.ClientSession() as session:
+    """Create one pooled HTTP client shared by every test, so connections are reused."""
+    async with _make_client() as session:
         yield session
 
-@pytest.mark.asyncio
-async def test_chat_endpoint(session: aiohttp.ClientSession):
-    """Test the /chat endpoint."""
-    message = "I need help analyzing a research paper on machine learning"
-    url = f"{BASE_URL}/chat"
-    
-    payload = {
-        "message": message,
-        "user_id": "test_user",
-        "session_id": "test_session"
-    }
-    
-    try:
-        async with session.post(url, json=payload) as response:
-            result = await response.json()
-            print(f"\n📝 Test Message: {message}")
-            print(f"✅ Status: {response.status}")
-            print(f"🤖 Response: {result.get('response', 'No response')}")
-            print(f"🔧 Agent Used: {result.get('agent_used', 'None')}")
-            print(f"🎯 Routing Reason: {result.get('routing_reason', 'None')}")
-            assert response.status == 200
-            assert "response" in result
-            return result
-    except Exception as e:
-        print(f"❌ Error testing chat endpoint: {e}")
-        pytest.fail(f"Chat endpoint test failed: {e}")
-
-@pytest.mark.asyncio
-async def test_agents_endpoint(session: aiohttp.ClientSession):
-    """Test the /chat/agents endpoint."""
-    url = f"{BASE_URL}/chat/agents"
-    
-    try:
-        async with session.get(url) as response:
-            result = await response.json()
-            print(f"\n🔍 Available Agents:")
-            print(f"✅ Status: {response.status}")
-            print(f"📋 Agents: {result.get('available_agents', [])}")
-            print(f"📊 Total: {result.get('total_agents', 0)}")
-            print(f"🟢 Service Status: {result.get('service_status', 'unknown')}")
-            assert response.status == 200
-            assert "available_agents" in result
-            return result
-    except Exception as e:
-        print(f"❌ Error testing agents endpoint: {e}")
-        pytest.fail(f"Agents endpoint test failed: {e}")
+# (path, method, request body, required response key, heading, printed (label, key, default) fields)
+ENDPOINTS = [
+    pytest.param(
+        "/chat", "POST",
+        {
+            "message": "I need help analyzing a research paper on machine learning",
+            "user_id": "test_user",
+            "session_id": "test_session"
+        },
+        "response",
+        "📝 Test Message: I need help analyzing a research paper on machine learning",
+        (("🤖 Response", "response", "No response"),
+         ("🔧 Agent Used", "agent_used", "None"),
+         ("🎯 Routing Reason", "routing_reason", "None")),
+        id="chat",
+    ),
+    pytest.param(
+        "/chat/agents", "GET", None, "available_agents",
+        "🔍 Available Agents:",
+        (("📋 Agents", "available_agents", []),
+         ("📊 Total", "total_agents", 0),
+         ("🟢 Service Status", "service_status", "unknown")),
+        id="agents",
+    ),
+    pytest.param(
+        "/chat/health", "GET", None, "status",
+        "🏥 Chat Health Check:",
+        (("🟢 Chat Service", "chat_service", "unknown"),
+         ("📊 Available Agents", "available_agents", 0),
+         ("🟢 Overall Status", "status", "unknown")),
+        id="health",
+    ),
+]
 
-@pytest.mark.asyncio
-async def test_health_endpoint(session: aiohttp.ClientSession):
-    """Test the /chat/health endpoint."""
-    url = f"{BASE_URL}/chat/health"
-    
+@pytest.mark.asyncio(loop_scope="session")
+@pytest.mark.parametrize("path,method,body,required,heading,fields", ENDPOINTS)
+async def test_endpoint(session: httpx.AsyncClient, path, method, body, required, heading, fields):
+    """Test one chat API endpoint from the ENDPOINTS table."""
     try:
-        async with session.get(url) as response:
-            result = await response.json()
-            print(f"\n🏥 Chat Health Check:")
-            print(f"✅ Status: {response.status}")
-            print(f"🟢 Chat Service: {result.get('chat_service', 'unknown')}")
-            print(f"📊 Available Agents: {result.get('available_agents', 0)}")
-            print(f"🟢 Overall Status: {result.get('status', 'unknown')}")
-            assert response.status == 200
-            assert "status" in result
-            return result
+        response = await session.request(method, f"{BASE_URL}{path}", json=body)
+        result = response.json()
+        print(f"\n{heading}")
+        print(f"✅ Status: {response.status_code}")
+        for label, key, default in fields:
+            print(f"{label}: {result.get(key, default)}")
+        assert response.status_code == 200
+        assert required in result
     except Exception as e:
-        print(f"❌ Error testing health endpoint: {e}")
-        pytest.fail(f"Health endpoint test failed: {e}")
+        print(f"❌ Error testing {path} endpoint: {e}")
+        pytest.fail(f"{path} endpoint test failed: {e}")
 
 # Standalone functions for running outside pytest
-async def test_chat_endpoint_standalone(session: aiohttp.ClientSession, message: str, user_id: str = None) -> Dict[str, Any]:
+async def test_chat_endpoint_standalone(session: httpx.AsyncClient, message: str, user_id: str = None) -> Dict[str, Any]:
     """Test the /chat endpoint (standalone version)."""
-    url = f"{BASE_URL}/chat"
-    
-    payload = {
-        "message": message,
-        "user_id": user_id,
-        "session_id": "test_session"
-    }
+    body = orjson.dumps({**_CHAT_PAYLOAD_TEMPLATE, "message": message, "user_id": user_id})
     
     try:
-        async with session.post(url, json=payload) as response:
-            result = await response.json()
-            print(f"\n📝 Test Message: {message}")
-            print(f"✅ Status: {response.status}")
-            print(f"🤖 Response: {result.get('response', 'No response')}")
-            print(f"🔧 Agent Used: {result.get('agent_used', 'None')}")
-            print(f"🎯 Routing Reason: {result.get('routing_reason', 'None')}")
-            return result
+        response = await session.post(CHAT_URL, content=body, headers=_JSON_HEADERS)
+        result = response.json()
+        print(f"\n📝 Test Message: {message}")
+        print(f"✅ Status: {response.status_code}")
+        print(f"🤖 Response: {result.get('response', 'No response')}")
+        print(f"🔧 Agent Used: {result.get('agent_used', 'None')}")
+        print(f"🎯 Routing Reason: {result.get('routing_reason', 'None')}")
+        return result
     except Exception as e:
         print(f"❌ Error testing chat endpoint: {e}")
         return {"error": str(e)}
 
-async def test_agents_endpoint_standalone(session: aiohttp.ClientSession) -> Dict[str, Any]:
+async def test_agents_endpoint_standalone(session: httpx.AsyncClient) -> Dict[str, Any]:
     """Test the /chat/agents endpoint (standalone version)."""
-    url = f"{BASE_URL}/chat/agents"
-    
     try:
-        async with session.get(url) as response:
-            result = await response.json()
-            print(f"\n🔍 Available Agents:")
-            print(f"✅ Status: {response.status}")
-            print(f"📋 Agents: {result.get('available_agents', [])}")
-            print(f"📊 Total: {result.get('total_agents', 0)}")
-            print(f"🟢 Service Status: {result.get('service_status', 'unknown')}")
-            return result
+        response = await session.get(AGENTS_URL)
+        result = response.json()
+        print(f"\n🔍 Available Agents:")
+        print(f"✅ Status: {response.status_code}")
+        print(f"📋 Agents: {result.get('available_agents', [])}")
+        print(f"📊 Total: {result.get('total_agents', 0)}")
+        print(f"🟢 Service Status: {result.get('service_status', 'unknown')}")
+        return result
     except Exception as e:
         print(f"❌ Error testing agents endpoint: {e}")
         return {"error": str(e)}
 
-async def test_health_endpoint_standalone(session: aiohttp.ClientSession) -> Dict[str, Any]:
+async def test_health_endpoint_standalone(session: httpx.AsyncClient) -> Dict[str, Any]:
     """Test the /chat/health endpoint (standalone version)."""
-    url = f"{BASE_URL}/chat/health"
-    
     try:
-        async with session.get(url) as response:
-            result = await response.json()
-            print(f"\n🏥 Chat Health Check:")
-            print(f"✅ Status: {response.status}")
-            print(f"🟢 Chat Service: {result.get('chat_service', 'unknown')}")
-            print(f"📊 Available Agents: {result.get('available_agents', 0)}")
-            print(f"🟢 Overall Status: {result.get('status', 'unknown')}")
-            return result
+        response = await session.get(HEALTH_URL)
+        result = response.json()
+        print(f"\n🏥 Chat Health Check:")
+        print(f"✅ Status: {response.status_code}")
+        print(f"🟢 Chat Service: {result.get('chat_service', 'unknown')}")
+        print(f"📊 Available Agents: {result.get('available_agents', 0)}")
+        print(f"🟢 Overall Status: {result.get('status', 'unknown')}")
+        return result
     except Exception as e:
         print(f"❌ Error testing health endpoint: {e}")
         return {"error": str(e)}
@@ -157,7 +152,8 @@ async def main():
         "I want to understand economic policy research"
     ]
     
-    async with aiohttp.ClientSession() as session:
+    # One keep-alive connection pool shared by every request
+    async with _make_client() as session:
         # Test health endpoint first
         print("\n1️⃣ Testing Health Endpoint...")
         await test_health_endpoint_standalone(session)
@@ -166,14 +162,21 @@ async def main():
         print("\n2️⃣ Testing Agents Endpoint...")
         await test_agents_endpoint_standalone(session)
         
-        # Test chat endpoint with different messages
+        # Test chat endpoint with different messages, all in flight at once
         print("\n3️⃣ Testing Chat Endpoint...")
-        for i, message in enumerate(test_messages, 1):
-            print(f"\n--- Test {i} ---")
-            await test_chat_endpoint_standalone(session, message, f"test_user_{i}")
-            await asyncio.sleep(1)  # Small delay between requests
+        in_flight = asyncio.Semaphore(16)
+        
+        async def run_chat_test(message: str, user_id: str) -> Dict[str, Any]:
+            async with in_flight:
+                return await test_chat_endpoint_standalone(session, message, user_id)
+        
+        # The helpers report their own request errors, so anything escaping
+        # here is unexpected and cancels the rest instead of leaking tasks
+        async with asyncio.TaskGroup() as tg:
+            for i, message in enumerate(test_messages, 1):
+                tg.create_task(run_chat_test(message, f"test_user_{i}"))
     
     print("\n🎉 Chat API testing completed!")
 
 if __name__ == "__main__":
-    asyncio.run(main()) 
\ No newline at end of file
+    (uvloop.run if uvloop else asyncio.run)(main()) 
\ No newline at end of file
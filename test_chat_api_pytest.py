@@ -5,82 +5,70 @@ Pytest-compatible test script for the Videmy Study Chat API endpoints.
 
 import asyncio
 import aiohttp
-import json
+import orjson
 import pytest
+import pytest_asyncio
 from typing import Dict, Any
 
 # API base URL (adjust as needed)
 BASE_URL = "http://localhost:8000"
+_JSON_HEADERS = {"Content-Type": "application/json"}
 
-@pytest.fixture
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
 async def session():
-    """Create an aiohttp session for testing."""
-    async with aiohttp.ClientSession() as session:
+    """Create one pooled aiohttp session shared by every test, so connections are reused."""
+    connector = aiohttp.TCPConnector(limit=256, limit_per_host=64, ttl_dns_cache=300, keepalive_timeout=75)
+    async with aiohttp.ClientSession(connector=connector) as session:
         yield session
 
-@pytest.mark.asyncio
-async def test_chat_endpoint(session: aiohttp.ClientSession):
-    """Test the /chat endpoint."""
-    message = "I need help analyzing a research paper on machine learning"
-    url = f"{BASE_URL}/chat"
-    
-    payload = {
-        "message": message,
-        "user_id": "test_user",
-        "session_id": "test_session"
-    }
-    
-    try:
-        async with session.post(url, json=payload) as response:
-            result = await response.json()
-            print(f"\n📝 Test Message: {message}")
-            print(f"✅ Status: {response.status}")
-            print(f"🤖 Response: {result.get('response', 'No response')}")
-            print(f"🔧 Agent Used: {result.get('agent_used', 'None')}")
-            print(f"🎯 Routing Reason: {result.get('routing_reason', 'None')}")
-            assert response.status == 200
-            assert "response" in result
-            return result
-    except Exception as e:
-        print(f"❌ Error testing chat endpoint: {e}")
-        pytest.fail(f"Chat endpoint test failed: {e}")
-
-@pytest.mark.asyncio
-async def test_agents_endpoint(session: aiohttp.ClientSession):
-    """Test the /chat/agents endpoint."""
-    url = f"{BASE_URL}/chat/agents"
-    
-    try:
-        async with session.get(url) as response:
-            result = await response.json()
-            print(f"\n🔍 Available Agents:")
-            print(f"✅ Status: {response.status}")
-            print(f"📋 Agents: {result.get('available_agents', [])}")
-            print(f"📊 Total: {result.get('total_agents', 0)}")
-            print(f"🟢 Service Status: {result.get('service_status', 'unknown')}")
-            assert response.status == 200
-            assert "available_agents" in result
-            return result
-    except Exception as e:
-        print(f"❌ Error testing agents endpoint: {e}")
-        pytest.fail(f"Agents endpoint test failed: {e}")
+# (path, method, request body, required response key, heading, printed (label, key, default) fields)
+ENDPOINTS = [
+    pytest.param(
+        "/chat", "POST",
+        {
+            "message": "I need help analyzing a research paper on machine learning",
+            "user_id": "test_user",
+            "session_id": "test_session"
+        },
+        "response",
+        "📝 Test Message: I need help analyzing a research paper on machine learning",
+        (("🤖 Response", "response", "No response"),
+         ("🔧 Agent Used", "agent_used", "None"),
+         ("🎯 Routing Reason", "routing_reason", "None")),
+        id="chat",
+    ),
+    pytest.param(
+        "/chat/agents", "GET", None, "available_agents",
+        "🔍 Available Agents:",
+        (("📋 Agents", "available_agents", []),
+         ("📊 Total", "total_agents", 0),
+         ("🟢 Service Status", "service_status", "unknown")),
+        id="agents",
+    ),
+    pytest.param(
+        "/chat/health", "GET", None, "status",
+        "🏥 Chat Health Check:",
+        (("🟢 Chat Service", "chat_service", "unknown"),
+         ("📊 Available Agents", "available_agents", 0),
+         ("🟢 Overall Status", "status", "unknown")),
+        id="health",
+    ),
+]
 
-@pytest.mark.asyncio
-async def test_health_endpoint(session: aiohttp.ClientSession):
-    """Test the /chat/health endpoint."""
-    url = f"{BASE_URL}/chat/health"
-    
+@pytest.mark.asyncio(loop_scope="session")
+@pytest.mark.parametrize("path,method,body,required,heading,fields", ENDPOINTS)
+async def test_endpoint(session: aiohttp.ClientSession, path, method, body, required, heading, fields):
+    """Test one chat API endpoint from the ENDPOINTS table."""
+    data = None if body is None else orjson.dumps(body)
     try:
-        async with session.get(url) as response:
-            result = await response.json()
-            print(f"\n🏥 Chat Health Check:")
+        async with session.request(method, f"{BASE_URL}{path}", data=data, headers=_JSON_HEADERS) as response:
+            result = orjson.loads(await response.read())
+            print(f"\n{heading}")
             print(f"✅ Status: {response.status}")
-            print(f"🟢 Chat Service: {result.get('chat_service', 'unknown')}")
-            print(f"📊 Available Agents: {result.get('available_agents', 0)}")
-            print(f"🟢 Overall Status: {result.get('status', 'unknown')}")
+            for label, key, default in fields:
+                print(f"{label}: {result.get(key, default)}")
             assert response.status == 200
-            assert "status" in result
-            return result
+            assert required in result
     except Exception as e:
-        print(f"❌ Error testing health endpoint: {e}")
-        pytest.fail(f"Health endpoint test failed: {e}") 
\ No newline at end of file
+        print(f"❌ Error testing {path} endpoint: {e}")
+        pytest.fail(f"{path} endpoint test failed: {e}")
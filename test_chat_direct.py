@@ -4,12 +4,12 @@ Direct test of the chat manager to verify it's working properly.
 """
 
 import asyncio
-import sys
-from pathlib import Path
+import traceback
 
-# Add the backend directory to the path
-backend_dir = Path(__file__).parent
-sys.path.insert(0, str(backend_dir))
+try:
+    import uvloop  # not available on Windows
+except ImportError:
+    uvloop = None
 
 from managers.chat_manager import chat_manager
 
@@ -27,27 +27,37 @@ async def test_chat_manager():
         "I want to understand economic policy research"
     ]
     
-    for i, message in enumerate(test_messages, 1):
-        print(f"\n🔍 Test {i}: '{message}'")
-        print("-" * 40)
-        
-        try:
-            response = await chat_manager.process_chat_message(
+    # The messages are independent, so run them all at once (at most 8 in
+    # flight) and report in order once they have finished
+    in_flight = asyncio.Semaphore(8)
+    
+    async def run_message(i: int, message: str):
+        async with in_flight:
+            return await chat_manager.process_chat_message(
                 message=message,
                 user_id=f"test_user_{i}",
                 session_id=f"test_session_{i}"
             )
-            
-            print(f"✅ Success: {response['success']}")
-            print(f"📝 Message: {response['message']}")
-            print(f"🤖 Response: {response['response'][:200]}...")
-            print(f"🔧 Agent Used: {response['agent_used']}")
-            print(f"🎯 Routing Reason: {response['routing_reason']}")
-            
-        except Exception as e:
-            print(f"❌ Error: {e}")
-            import traceback
-            traceback.print_exc()
+    
+    responses = await asyncio.gather(
+        *(run_message(i, message) for i, message in enumerate(test_messages, 1)),
+        return_exceptions=True
+    )
+    
+    for i, (message, response) in enumerate(zip(test_messages, responses), 1):
+        print(f"\n🔍 Test {i}: '{message}'")
+        print("-" * 40)
+        
+        if isinstance(response, Exception):
+            print(f"❌ Error: {response}")
+            traceback.print_exception(response)
+            continue
+        
+        print(f"✅ Success: {response['success']}")
+        print(f"📝 Message: {response['message']}")
+        print(f"🤖 Response: {response['response'][:200]}...")
+        print(f"🔧 Agent Used: {response['agent_used']}")
+        print(f"🎯 Routing Reason: {response['routing_reason']}")
     
     print("\n🎉 Chat manager test completed!")
 
@@ -56,6 +66,9 @@ async def main():
     print("🚀 Videmy Study Chat Manager Test")
     print("=" * 50)
     
+    # Pay the one-off agent import before the test messages
+    chat_manager.warm_up()
+    
     await test_chat_manager()
     
     print("\n📝 Summary:")
@@ -63,4 +76,4 @@ async def main():
     print("✅ Check if responses are dynamic or still hardcoded")
 
 if __name__ == "__main__":
-    asyncio.run(main()) 
\ No newline at end of file
+    (uvloop.run if uvloop else asyncio.run)(main()) 
\ No newline at end of file
@@ -4,15 +4,13 @@ Test script for the chat integration with ADK routing agent.
 """
 
 import asyncio
-import sys
-import os
-from pathlib import Path
 
-# Add the backend directory to Python path
-backend_dir = Path(__file__).parent
-sys.path.insert(0, str(backend_dir))
+try:
+    import uvloop  # not available on Windows
+except ImportError:
+    uvloop = None
 
-from managers.chat_manager_clean import chat_manager
+from managers.chat_manager import chat_manager
 
 async def test_chat_integration():
     """Test the chat integration with various message types."""
@@ -20,6 +18,9 @@ async def test_chat_integration():
     print("🧪 Testing Chat Integration with ADK Routing Agent")
     print("=" * 60)
     
+    # Pay the one-off agent import before the first test message
+    chat_manager.warm_up()
+    
     # Test messages for different routing scenarios
     test_messages = [
         {
@@ -82,4 +83,4 @@ async def test_chat_integration():
     print("\n🎉 Chat integration test completed!")
 
 if __name__ == "__main__":
-    asyncio.run(test_chat_integration()) 
\ No newline at end of file
+    (uvloop.run if uvloop else asyncio.run)(test_chat_integration()) 
\ No newline at end of file
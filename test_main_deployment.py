@@ -3,37 +3,47 @@
 Test script to verify Videmy Study API deployment on Render.
 """
 
-import requests
-import json
+import asyncio
+import httpx
+import io
+import orjson
+import os
 import sys
 from typing import Dict, Any
 
-def test_endpoint(base_url: str, endpoint: str, method: str = "GET", data: Dict[str, Any] = None) -> Dict[str, Any]:
+try:
+    import uvloop  # not available on Windows
+except ImportError:
+    uvloop = None
+
+# Generous per-request budget: a cold Render instance can take a while to wake
+_REQUEST_TIMEOUT_SECONDS = 30.0
+
+async def test_endpoint(client: httpx.AsyncClient, endpoint: str,
+                        method: str = "GET", data: Dict[str, Any] = None) -> Dict[str, Any]:
     """Test a specific endpoint."""
-    url = f"{base_url}{endpoint}"
+    url = f"{str(client.base_url).rstrip('/')}{endpoint}"  # httpx keeps a trailing slash on base_url
+    
+    if method not in ("GET", "POST"):
+        return {"error": f"Unsupported method: {method}"}
     
     try:
-        if method == "GET":
-            response = requests.get(url, timeout=30)
-        elif method == "POST":
-            response = requests.post(url, json=data, timeout=30)
-        else:
-            return {"error": f"Unsupported method: {method}"}
-        
+        response = await client.request(method, endpoint, json=data)
+        is_json = response.headers.get("content-type", "").startswith("application/json")
         return {
             "status_code": response.status_code,
             "success": response.status_code < 400,
-            "data": response.json() if response.headers.get('content-type', '').startswith('application/json') else response.text,
+            "data": orjson.loads(response.content) if is_json else response.text,
             "url": url
         }
-    except requests.exceptions.RequestException as e:
+    except (httpx.HTTPError, orjson.JSONDecodeError) as e:
         return {
             "error": str(e),
             "success": False,
             "url": url
         }
 
-def main():
+async def main():
     """Run deployment tests."""
     # Get base URL from command line or use default
     if len(sys.argv) > 1:
@@ -41,9 +51,13 @@ def main():
     else:
         base_url = "http://localhost:8000"
     
-    print(f"🧪 Testing Videmy Study API Deployment")
-    print(f"📍 Base URL: {base_url}")
-    print("=" * 60)
+    # JSON_SUMMARY=1 swaps the human-readable report for one JSON line (for CI)
+    json_summary = bool(os.getenv("JSON_SUMMARY"))
+    
+    if not json_summary:
+        print(f"🧪 Testing Videmy Study API Deployment")
+        print(f"📍 Base URL: {base_url}")
+        print("=" * 60)
     
     # Test endpoints
     tests = [
@@ -64,44 +78,59 @@ def main():
         }),
     ]
     
-    results = []
+    # The endpoints are independent, so hit them all at once; against the
+    # HTTPS deployment HTTP/2 multiplexes them over a single connection
+    async with httpx.AsyncClient(http2=True, base_url=base_url, timeout=_REQUEST_TIMEOUT_SECONDS) as client:
+        endpoint_results = await asyncio.gather(*(
+            test_endpoint(client, endpoint, method, *args)
+            for _, endpoint, method, *args in tests
+        ))
     
-    for test_name, endpoint, method, *args in tests:
-        print(f"\n🔍 Testing: {test_name}")
-        print(f"   Endpoint: {method} {endpoint}")
-        
-        data = args[0] if args else None
-        result = test_endpoint(base_url, endpoint, method, data)
+    passed = sum(1 for result in endpoint_results if result.get("success"))
+    total = len(endpoint_results)
+    
+    if json_summary:
+        sys.stdout.buffer.write(orjson.dumps({
+            "passed": passed,
+            "total": total,
+            "results": [{"test": test_name, **result} for (test_name, *_), result in zip(tests, endpoint_results)],
+        }) + b"\n")
+        return passed == total
+    
+    # Build the whole report first and write it out in one go
+    report = io.StringIO()
+    
+    for (test_name, endpoint, method, *_), result in zip(tests, endpoint_results):
+        print(f"\n🔍 Testing: {test_name}", file=report)
+        print(f"   Endpoint: {method} {endpoint}", file=report)
         
         if result.get("success"):
-            print(f"   ✅ Status: {result['status_code']}")
+            print(f"   ✅ Status: {result['status_code']}", file=report)
             if "data" in result and isinstance(result["data"], dict):
                 if "response" in result["data"]:
-                    print(f"   🤖 Response: {result['data']['response'][:100]}...")
+                    print(f"   🤖 Response: {result['data']['response'][:100]}...", file=report)
                 if "agent_used" in result["data"]:
-                    print(f"   🔧 Agent: {result['data']['agent_used']}")
+                    print(f"   🔧 Agent: {result['data']['agent_used']}", file=report)
         else:
-            print(f"   ❌ Error: {result.get('error', 'Unknown error')}")
-        
-        results.append((test_name, result))
+            print(f"   ❌ Error: {result.get('error', 'Unknown error')}", file=report)
     
     # Summary
-    print("\n" + "=" * 60)
-    print("📊 Test Summary:")
-    
-    passed = sum(1 for _, result in results if result.get("success"))
-    total = len(results)
+    print("\n" + "=" * 60, file=report)
+    print("📊 Test Summary:", file=report)
     
-    print(f"   ✅ Passed: {passed}/{total}")
-    print(f"   ❌ Failed: {total - passed}/{total}")
+    print(f"   ✅ Passed: {passed}/{total}", file=report)
+    print(f"   ❌ Failed: {total - passed}/{total}", file=report)
     
     if passed == total:
-        print("🎉 All tests passed! Your API is working correctly.")
+        print("🎉 All tests passed! Your API is working correctly.", file=report)
     else:
-        print("⚠️  Some tests failed. Check the logs above for details.")
+        print("⚠️  Some tests failed. Check the logs above for details.", file=report)
+    
+    sys.stdout.write(report.getvalue())
+    sys.stdout.flush()
     
     return passed == total
 
 if __name__ == "__main__":
-    success = main()
+    success = (uvloop.run if uvloop else asyncio.run)(main())
     sys.exit(0 if success else 1) 
\ No newline at end of file
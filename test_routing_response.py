@@ -2,6 +2,12 @@ import sys
 import asyncio
 from pathlib import Path
 import logging
+import traceback
+
+try:
+    import uvloop  # not available on Windows
+except ImportError:
+    uvloop = None
 
 # Add the routing agent to the path
 current_dir = Path(__file__).parent
@@ -14,46 +20,55 @@ from routing_agent.agent import routing_agent
 logging.basicConfig(level=logging.DEBUG)
 logger = logging.getLogger(__name__)
 
-async def test_routing_response():
+_QUERY = "Can you help me with academic research?"
+
+# A stuck agent fails the run instead of hanging it
+_FIRST_RESPONSE_TIMEOUT_SECONDS = 10.0
+
+def _print_response(response):
+    if hasattr(response, 'output'):
+        print(f"Output: {response.output}")
+    if hasattr(response, 'content'):
+        print(f"Content: {response.content}")
+    if hasattr(response, 'text'):
+        print(f"Text: {response.text}")
+    if hasattr(response, 'message'):
+        print(f"Message: {response.message}")
+
+async def _try_construct():
+    response = routing_agent.construct(_QUERY)
+    logger.debug(f"Construct response type: {type(response)}; Value: {response}")
+    _print_response(response)
+
+async def _try_run_live():
+    # Only the first item is needed; close the generator straight after
+    # so the agent releases its connection instead of waiting for GC
+    responses = routing_agent.run_live(_QUERY)
     try:
-        print("Testing routing agent response with construct method...")
-        
-        # Try using the construct method instead
-        response = routing_agent.construct("Can you help me with academic research?")
-        logger.debug(f"Construct response type: {type(response)}; Value: {response}")
-        
-        if hasattr(response, 'output'):
-            print(f"Output: {response.output}")
-        if hasattr(response, 'content'):
-            print(f"Content: {response.content}")
-        if hasattr(response, 'text'):
-            print(f"Text: {response.text}")
-        if hasattr(response, 'message'):
-            print(f"Message: {response.message}")
-            
-    except Exception as e:
-        logger.error(f"Error with construct: {e}")
-        import traceback
-        logger.error(traceback.format_exc())
+        response = await asyncio.wait_for(anext(responses, None), timeout=_FIRST_RESPONSE_TIMEOUT_SECONDS)
+    finally:
+        await responses.aclose()
+    if response is not None:
+        logger.debug(f"Yielded type: {type(response)}; Value: {response}")
+        _print_response(response)
+
+# Invocation strategies in preference order; each later one is a fallback
+# for when the previous one raises
+_STRATEGIES = (("construct", _try_construct), ("run_live", _try_run_live))
+
+async def test_routing_response():
+    for attempt, (name, run) in enumerate(_STRATEGIES):
+        if attempt == 0:
+            print(f"Testing routing agent response with {name} method...")
+        else:
+            print(f"\nTrying {name} as fallback...")
         
-        # Try run_live as fallback
         try:
-            print("\nTrying run_live as fallback...")
-            response_gen = routing_agent.run_live("Can you help me with academic research?")
-            async for response in response_gen:
-                logger.debug(f"Yielded type: {type(response)}; Value: {response}")
-                if hasattr(response, 'output'):
-                    print(f"Output: {response.output}")
-                if hasattr(response, 'content'):
-                    print(f"Content: {response.content}")
-                if hasattr(response, 'text'):
-                    print(f"Text: {response.text}")
-                if hasattr(response, 'message'):
-                    print(f"Message: {response.message}")
-                break
-        except Exception as e2:
-            logger.error(f"Error with run_live fallback: {e2}")
+            await run()
+            return
+        except Exception as e:
+            logger.error(f"Error with {name}: {e}")
             logger.error(traceback.format_exc())
 
 if __name__ == "__main__":
-    asyncio.run(test_routing_response()) 
\ No newline at end of file
+    (uvloop.run if uvloop else asyncio.run)(test_routing_response()) 
\ No newline at end of file